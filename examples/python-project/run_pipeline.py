@@ -3,11 +3,11 @@
 This script shows three ways to use the Pipeline API:
 1. Zero-flag — reads config from pyproject.toml
 2. Explicit args — pass everything in code
-3. Custom gate — add a Python callable quality gate
+3. Custom gates — a literal-pattern gate, a print() call gate and a Python callable gate
 """
 
-import subprocess
 import sys
+from pathlib import Path
 
 from agentic_dev_pipeline import Pipeline
 
@@ -30,29 +30,12 @@ def run_explicit():
     sys.exit(0 if converged else 1)
 
 
-# ── 3. Custom gate ───────────────────────────────────────
-def no_todos() -> tuple[bool, str]:
-    """Fail if any TODO comments remain in source code."""
-    result = subprocess.run(
-        ["grep", "-rn", "TODO", "src/"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0:
-        return False, f"Found TODOs:\n{result.stdout}"
-    return True, "No TODOs found"
-
-
-def no_print_statements() -> tuple[bool, str]:
-    """Fail if any print() calls remain in source code."""
-    result = subprocess.run(
-        ["grep", "-rn", "print(", "src/"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0:
-        return False, f"Found print() calls:\n{result.stdout}"
-    return True, "No print() calls found"
+# ── 3. Custom gates ──────────────────────────────────────
+def has_changelog() -> tuple[bool, str]:
+    """Fail if the project has no CHANGELOG.md."""
+    if Path("CHANGELOG.md").is_file():
+        return True, "CHANGELOG.md present"
+    return False, "CHANGELOG.md is missing"
 
 
 def run_with_gates():
@@ -61,8 +44,10 @@ def run_with_gates():
             prompt_file="PROMPT.md",
             requirements_file="requirements.md",
         )
-        .add_gate("no-todos", no_todos)
-        .add_gate("no-print", no_print_statements)
+        # Pattern gates share one in-process scan of the source dirs per iteration
+        .add_gate("no-todos", pattern="TODO")
+        .add_gate("no-print", call="print")
+        .add_gate("has-changelog", has_changelog)
         .run()
     )
     sys.exit(0 if converged else 1)
@@ -1,27 +1,74 @@
-from importlib.metadata import PackageNotFoundError, version
+from __future__ import annotations
 
-try:
-    __version__ = version("agentic-dev-pipeline")
-except PackageNotFoundError:
-    __version__ = "0.0.0+unknown"
+import importlib
+from typing import TYPE_CHECKING
 
-from agentic_dev_pipeline.api import Pipeline
-from agentic_dev_pipeline.detect import ProjectConfig, detect_all
-from agentic_dev_pipeline.domain import GateFunction, GateStatus
-from agentic_dev_pipeline.log import Logger
-from agentic_dev_pipeline.pipeline import run_pipeline
-from agentic_dev_pipeline.runner import ClaudeRunner
-from agentic_dev_pipeline.verify import run_triangular_verification
+if TYPE_CHECKING:
+    from agentic_dev_pipeline.api import Pipeline
+    from agentic_dev_pipeline.detect import ProjectConfig, detect_all
+    from agentic_dev_pipeline.domain import GateFunction, GateStatus, sequential_gate
+    from agentic_dev_pipeline.gates import PatternGateBatch
+    from agentic_dev_pipeline.log import Logger
+    from agentic_dev_pipeline.pipeline import run_pipeline
+    from agentic_dev_pipeline.runner import ClaudeRunner
+    from agentic_dev_pipeline.verify import run_triangular_verification
+
+    __version__: str  # resolved lazily by __getattr__ below
+
+# Public name → defining submodule. Submodules are imported on first access
+# (PEP 562) so `import agentic_dev_pipeline` stays cheap for the CLI.
+_EXPORTS: dict[str, str] = {
+    "ClaudeRunner": "agentic_dev_pipeline.runner",
+    "GateFunction": "agentic_dev_pipeline.domain",
+    "GateStatus": "agentic_dev_pipeline.domain",
+    "Logger": "agentic_dev_pipeline.log",
+    "PatternGateBatch": "agentic_dev_pipeline.gates",
+    "Pipeline": "agentic_dev_pipeline.api",
+    "ProjectConfig": "agentic_dev_pipeline.detect",
+    "detect_all": "agentic_dev_pipeline.detect",
+    "run_pipeline": "agentic_dev_pipeline.pipeline",
+    "run_triangular_verification": "agentic_dev_pipeline.verify",
+    "sequential_gate": "agentic_dev_pipeline.domain",
+}
 
 __all__ = [
     "ClaudeRunner",
     "GateFunction",
     "GateStatus",
     "Logger",
+    "PatternGateBatch",
     "Pipeline",
     "ProjectConfig",
     "__version__",
     "detect_all",
     "run_pipeline",
     "run_triangular_verification",
+    "sequential_gate",
 ]
+
+
+def _version() -> str:
+    # importlib.metadata alone costs more to import than the rest of the
+    # package, so the version is only looked up when asked for
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("agentic-dev-pipeline")
+    except PackageNotFoundError:
+        return "0.0.0+unknown"
+
+
+def __getattr__(name: str) -> object:
+    if name == "__version__":
+        globals()[name] = value = _version()
+        return value
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
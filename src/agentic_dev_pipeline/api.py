@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import os
+from functools import cached_property
 from pathlib import Path
 
 from agentic_dev_pipeline.config import PipelineConfig
 from agentic_dev_pipeline.detect import ProjectConfig, detect_all
 from agentic_dev_pipeline.domain import GateFunction
+from agentic_dev_pipeline.gates import PatternGateBatch
 from agentic_dev_pipeline.log import Logger
 from agentic_dev_pipeline.pipeline import run_pipeline
 from agentic_dev_pipeline.verify import run_triangular_verification
@@ -48,14 +50,39 @@ class Pipeline:
         self._config = PipelineConfig.resolve(explicit, project_root=root)
         self._project_root = root
         self._custom_gates: list[tuple[str, GateFunction]] = []
+        self._pattern_gates: list[tuple[str, str, str]] = []  # (name, "pattern"|"call", value)
+        self._detected: ProjectConfig | None = None
+        self._output_dir = Path(os.environ.get("OUTPUT_DIR", ".agentic-dev-pipeline"))
+        self._json_mode = os.environ.get("LOG_FORMAT", "").lower() == "json"
 
     @property
     def config(self) -> PipelineConfig:
         return self._config
 
-    def add_gate(self, name: str, func: GateFunction) -> Pipeline:
-        """Add a custom Python callable gate. Returns self for chaining."""
-        self._custom_gates.append((name, func))
+    def add_gate(
+        self,
+        name: str,
+        func: GateFunction | None = None,
+        *,
+        pattern: str | None = None,
+        call: str | None = None,
+    ) -> Pipeline:
+        """Add a custom gate. Returns self for chaining.
+
+        Pass exactly one of: a Python callable; ``pattern=`` to fail the gate
+        whenever that literal string appears in the project's source
+        directories; or ``call=`` to fail it whenever Python source calls that
+        function (comments and strings are ignored). All pattern and call
+        gates share a single scan of the tree per iteration.
+        """
+        if sum(arg is not None for arg in (func, pattern, call)) != 1:
+            raise ValueError("add_gate() takes exactly one of func, pattern or call")
+        if pattern is not None:
+            self._pattern_gates.append((name, "pattern", pattern))
+        elif call is not None:
+            self._pattern_gates.append((name, "call", call))
+        elif func is not None:
+            self._custom_gates.append((name, func))
         return self
 
     def run(self) -> bool:
@@ -72,21 +99,24 @@ class Pipeline:
                 "pyproject.toml / .agentic-dev-pipeline.toml / REQUIREMENTS_FILE env var."
             )
 
-        output_dir, logger, project_config = self._prepare()
-
-        return run_pipeline(
-            prompt_file=Path(cfg.prompt_file),
-            requirements_file=Path(cfg.requirements_file),
-            output_dir=output_dir,
-            max_iterations=cfg.max_iterations,
-            claude_timeout=cfg.timeout,
-            max_retries=cfg.max_retries,
-            config=project_config,
-            logger=logger,
-            custom_gates=self._custom_gates or None,
-            claude_model=cfg.claude_model,
-            claude_model_verify=cfg.claude_model_verify,
-        )
+        output_dir, logger, project_config = self._run_context
+        custom_gates = self._custom_gates + self._build_pattern_gates(project_config)
+
+        # The Logger reopens its file on next use, so closing here is safe
+        with logger:
+            return run_pipeline(
+                prompt_file=cfg.prompt_file,
+                requirements_file=cfg.requirements_file,
+                output_dir=output_dir,
+                max_iterations=cfg.max_iterations,
+                claude_timeout=cfg.timeout,
+                max_retries=cfg.max_retries,
+                config=project_config,
+                logger=logger,
+                custom_gates=custom_gates or None,
+                claude_model=cfg.claude_model,
+                claude_model_verify=cfg.claude_model_verify,
+            )
 
     def verify(self) -> bool:
         """Run triangular verification only. Returns True if passed."""
@@ -96,33 +126,44 @@ class Pipeline:
                 "requirements_file is required for verification."
             )
 
-        output_dir, logger, project_config = self._prepare()
+        output_dir, logger, project_config = self._run_context
 
-        return run_triangular_verification(
-            requirements_file=Path(cfg.requirements_file),
-            output_dir=output_dir,
-            config=project_config,
-            timeout=cfg.timeout,
-            max_retries=cfg.max_retries,
-            logger=logger,
-        )
+        with logger:
+            return run_triangular_verification(
+                requirements_file=cfg.requirements_file,
+                output_dir=output_dir,
+                config=project_config,
+                timeout=cfg.timeout,
+                max_retries=cfg.max_retries,
+                logger=logger,
+            )
 
     def detect(self) -> ProjectConfig:
         """Run project detection only. Returns detected config."""
-        return detect_all(
-            project_root=self._project_root,
-            base_branch=self._config.base_branch,
-        )
-
-    def _prepare(self) -> tuple[Path, Logger, ProjectConfig]:
-        """Create output_dir, logger, and project_config once."""
-        output_dir = Path(os.environ.get("OUTPUT_DIR", ".agentic-dev-pipeline"))
-        logger = Logger(
-            log_file=output_dir / "loop-execution.log",
-            json_mode=os.environ.get("LOG_FORMAT", "").lower() == "json",
-        )
-        project_config = detect_all(
-            project_root=self._project_root,
-            base_branch=self._config.base_branch,
-        )
-        return output_dir, logger, project_config
+        return self._detect()
+
+    def _detect(self) -> ProjectConfig:
+        """Run detect_all once per Pipeline; later calls reuse the result."""
+        if self._detected is None:
+            self._detected = detect_all(
+                project_root=self._project_root,
+                base_branch=self._config.base_branch,
+            )
+        return self._detected
+
+    def _build_pattern_gates(self, project_config: ProjectConfig) -> list[tuple[str, GateFunction]]:
+        """Bind registered pattern and call gates to one batch over the detected source dirs."""
+        if not self._pattern_gates:
+            return []
+        roots = [self._project_root / d for d in project_config.src_dirs.split()]
+        batch = PatternGateBatch(roots, base=self._project_root)
+        return [
+            (name, batch.call_gate(value) if kind == "call" else batch.gate(value))
+            for name, kind, value in self._pattern_gates
+        ]
+
+    @cached_property
+    def _run_context(self) -> tuple[Path, Logger, ProjectConfig]:
+        """Create output_dir, logger, and project_config once per Pipeline."""
+        logger = Logger(log_file=self._output_dir / "loop-execution.log", json_mode=self._json_mode)
+        return self._output_dir, logger, self._detect()
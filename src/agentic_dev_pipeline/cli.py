@@ -1,17 +1,46 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
+import stat
 import sys
+import threading
+import time
 from pathlib import Path
 
-from agentic_dev_pipeline import __version__
-from agentic_dev_pipeline.config import PipelineConfig
-from agentic_dev_pipeline.detect import detect_all
-from agentic_dev_pipeline.init_cmd import run_init
-from agentic_dev_pipeline.log import Logger
-from agentic_dev_pipeline.pipeline import run_pipeline
-from agentic_dev_pipeline.verify import run_triangular_verification
+# Subcommand modules are imported inside their branches in main() so that
+# fast paths (--version, detect, init) skip loading the pipeline machinery.
+
+
+def _version() -> str:
+    """Package version; importing it pulls in importlib.metadata, so only on demand."""
+    from agentic_dev_pipeline import __version__
+
+    return __version__
+
+
+class _VersionAction(argparse.Action):
+    """Like action="version", but the version is looked up only when the flag is given."""
+
+    def __init__(self, option_strings: list[str], dest: str = argparse.SUPPRESS, **kwargs: object):
+        super().__init__(
+            option_strings,
+            dest,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help="show program's version number and exit",
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: object,
+        option_string: str | None = None,
+    ) -> None:
+        print(f"{parser.prog} {_version()}")
+        parser.exit()
 
 
 def _positive_int(value: str) -> int:
@@ -21,6 +50,51 @@ def _positive_int(value: str) -> int:
     return n
 
 
+def _nonempty_file_error(path: Path, label: str) -> str | None:
+    """Return an error message unless *path* is a non-empty regular file (one stat call)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        return f"ERROR: {label} file not found: {path}"
+    if st.st_size == 0:
+        return f"ERROR: {label} file is empty: {path}"
+    return None
+
+
+# Upper bound on the input-file checks; only reached on a hung network mount
+_STAT_TIMEOUT = 5.0
+
+
+def _input_files_error(files: list[tuple[str, Path]]) -> str | None:
+    """Check the input files concurrently; return the first error, or None.
+
+    Each check runs on a daemon thread so a stat stuck on a hung mount costs at
+    most _STAT_TIMEOUT and cannot keep the process alive once we exit.
+    """
+    errors: list[str | None] = [None] * len(files)
+
+    def probe(i: int, label: str, path: Path) -> None:
+        errors[i] = _nonempty_file_error(path, label)
+
+    threads = [
+        threading.Thread(target=probe, args=(i, label, path), daemon=True)
+        for i, (label, path) in enumerate(files)
+    ]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + _STAT_TIMEOUT
+    for i, (t, (label, path)) in enumerate(zip(threads, files, strict=True)):
+        t.join(max(0.0, deadline - time.monotonic()))
+        if t.is_alive():
+            return f"ERROR: Timed out checking {label.lower()} file: {path}"
+        if errors[i]:
+            return errors[i]
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="agentic-dev-pipeline",
@@ -29,7 +103,7 @@ def _build_parser() -> argparse.ArgumentParser:
             "→ triangular verification → self-correction loop"
         ),
     )
-    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--version", action=_VersionAction)
 
     subparsers = parser.add_subparsers(dest="command")
 
@@ -143,6 +217,10 @@ def _build_parser() -> argparse.ArgumentParser:
 
 
 def main() -> None:
+    if sys.argv[1:] == ["--version"]:
+        print(f"agentic-dev-pipeline {_version()}")
+        sys.exit(0)
+
     parser = _build_parser()
     args = parser.parse_args()
 
@@ -151,11 +229,15 @@ def main() -> None:
         sys.exit(0)
 
     if args.command == "detect":
+        from agentic_dev_pipeline.detect import detect_all
+
         config = detect_all()
         print(config.print_config())
         sys.exit(0)
 
     if args.command == "init":
+        from agentic_dev_pipeline.init_cmd import run_init
+
         actions = run_init(force=args.force)
         for action in actions:
             print(action)
@@ -164,6 +246,10 @@ def main() -> None:
         sys.exit(0)
 
     if args.command == "verify":
+        from agentic_dev_pipeline.detect import detect_all
+        from agentic_dev_pipeline.log import Logger
+        from agentic_dev_pipeline.verify import run_triangular_verification
+
         requirements = args.requirements or os.environ.get("REQUIREMENTS_FILE")
         if not requirements:
             print(
@@ -183,19 +269,23 @@ def main() -> None:
         base_branch = args.base_branch or os.environ.get("BASE_BRANCH", "main")
         timeout = args.timeout or int(os.environ.get("CLAUDE_TIMEOUT", "300"))
         max_retries = args.max_retries or int(os.environ.get("MAX_RETRIES", "2"))
-        logger = Logger(log_file=output_dir / "loop-execution.log")
-
-        passed = run_triangular_verification(
-            requirements_file=req_path,
-            output_dir=output_dir,
-            config=detect_all(base_branch=base_branch),
-            timeout=timeout,
-            max_retries=max_retries,
-            logger=logger,
-        )
+        with Logger(log_file=output_dir / "loop-execution.log") as logger:
+            passed = run_triangular_verification(
+                requirements_file=req_path,
+                output_dir=output_dir,
+                config=detect_all(base_branch=base_branch),
+                timeout=timeout,
+                max_retries=max_retries,
+                logger=logger,
+            )
         sys.exit(0 if passed else 1)
 
     if args.command == "run":
+        from agentic_dev_pipeline.config import PipelineConfig
+        from agentic_dev_pipeline.detect import detect_all
+        from agentic_dev_pipeline.log import Logger
+        from agentic_dev_pipeline.pipeline import run_pipeline
+
         # Resolve shared config: CLI flags > pyproject.toml > .toml > env > defaults
         explicit: dict[str, object] = {}
         if args.prompt is not None:
@@ -224,11 +314,6 @@ def main() -> None:
             )
             sys.exit(1)
 
-        prompt_path = Path(cfg.prompt_file)
-        if not prompt_path.is_file():
-            print(f"ERROR: Prompt file not found: {prompt_path}", file=sys.stderr)
-            sys.exit(1)
-
         if cfg.requirements_file is None:
             print(
                 "ERROR: --requirements, config file, or REQUIREMENTS_FILE "
@@ -237,18 +322,15 @@ def main() -> None:
             )
             sys.exit(1)
 
-        req_path = Path(cfg.requirements_file)
-        if not req_path.is_file():
-            print(f"ERROR: Requirements file not found: {req_path}", file=sys.stderr)
-            sys.exit(1)
-
-        if prompt_path.stat().st_size == 0:
-            print(f"ERROR: Prompt file is empty: {prompt_path}", file=sys.stderr)
-            sys.exit(1)
+        prompt_path = cfg.prompt_file
+        req_path = cfg.requirements_file
 
-        if req_path.stat().st_size == 0:
-            print(f"ERROR: Requirements file is empty: {req_path}", file=sys.stderr)
+        # Detection (git subprocesses included) only runs once both inputs pass
+        error = _input_files_error([("Prompt", prompt_path), ("Requirements", req_path)])
+        if error:
+            print(error, file=sys.stderr)
             sys.exit(1)
+        project_config = detect_all(base_branch=cfg.base_branch)
 
         # CLI-only options: resolved from flags / env vars directly
         output_dir = Path(
@@ -256,23 +338,21 @@ def main() -> None:
         )
         webhook_url = args.webhook_url or os.environ.get("WEBHOOK_URL", "")
 
-        logger = Logger(log_file=output_dir / "loop-execution.log")
-        project_config = detect_all(base_branch=cfg.base_branch)
-
-        converged = run_pipeline(
-            prompt_file=prompt_path,
-            requirements_file=req_path,
-            output_dir=output_dir,
-            max_iterations=cfg.max_iterations,
-            claude_timeout=cfg.timeout,
-            max_retries=cfg.max_retries,
-            webhook_url=webhook_url,
-            parallel_gates=args.parallel_gates,
-            plugin_dir=args.plugin_dir,
-            config=project_config,
-            logger=logger,
-            claude_model=cfg.claude_model,
-            claude_model_verify=cfg.claude_model_verify,
-        )
+        with Logger(log_file=output_dir / "loop-execution.log") as logger:
+            converged = run_pipeline(
+                prompt_file=prompt_path,
+                requirements_file=req_path,
+                output_dir=output_dir,
+                max_iterations=cfg.max_iterations,
+                claude_timeout=cfg.timeout,
+                max_retries=cfg.max_retries,
+                webhook_url=webhook_url,
+                parallel_gates=args.parallel_gates,
+                plugin_dir=args.plugin_dir,
+                config=project_config,
+                logger=logger,
+                claude_model=cfg.claude_model,
+                claude_model_verify=cfg.claude_model_verify,
+            )
 
         sys.exit(0 if converged else 1)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import os
+import stat
 import tomllib
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
+from typing import ClassVar
 
 # TOML kebab-case → dataclass snake_case
 _KEY_MAP: dict[str, str] = {
@@ -27,9 +29,10 @@ _ENV_MAP: dict[str, str] = {
     "CLAUDE_MODEL": "claude_model",
     "CLAUDE_MODEL_VERIFY": "claude_model_verify",
 }
+_ENV_ITEMS = tuple(_ENV_MAP.items())
 
-_INT_FIELDS = {"max_iterations", "timeout", "max_retries"}
-_PATH_FIELDS = {"prompt_file", "requirements_file"}
+_INT_FIELDS = frozenset({"max_iterations", "timeout", "max_retries"})
+_PATH_FIELDS = frozenset({"prompt_file", "requirements_file"})
 
 
 def _coerce(key: str, value: object) -> object:
@@ -37,27 +40,49 @@ def _coerce(key: str, value: object) -> object:
     if key in _INT_FIELDS:
         return int(value)  # type: ignore[arg-type]
     if key in _PATH_FIELDS and value is not None:
-        return Path(str(value))
+        return value if isinstance(value, Path) else Path(str(value))
     return value
 
 
 def _normalize_toml(raw: dict[str, object]) -> dict[str, object]:
     """Convert TOML kebab-case keys to snake_case dataclass fields."""
-    result: dict[str, object] = {}
-    for k, v in raw.items():
-        field_name = _KEY_MAP.get(k, k.replace("-", "_"))
-        result[field_name] = _coerce(field_name, v)
-    return result
+    # Known keys cost one dict lookup; only unknown ones pay for str.replace
+    return {
+        (name := _KEY_MAP.get(k) or k.replace("-", "_")): _coerce(name, v) for k, v in raw.items()
+    }
+
+
+# Parsed TOML per absolute path, tagged with the (mtime_ns, size) it was read at
+_TOML_CACHE: dict[str, tuple[tuple[int, int], dict[str, object]]] = {}
 
 
 def _read_toml(path: Path) -> dict[str, object]:
-    """Read a TOML file, returning empty dict on failure."""
-    if not path.is_file():
+    """Read a TOML file, returning empty dict on failure.
+
+    Results are cached until the file's mtime or size changes, so repeated
+    resolves in one process parse each file once. Callers must not mutate
+    the returned dict.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    if not stat.S_ISREG(st.st_mode):
         return {}
+
+    cache_key = os.path.abspath(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _TOML_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     try:
-        return tomllib.loads(path.read_text())  # type: ignore[return-value]
+        with path.open("rb") as f:
+            data: dict[str, object] = tomllib.load(f)
     except Exception:
-        return {}
+        data = {}
+    _TOML_CACHE[cache_key] = (stamp, data)
+    return data
 
 
 @dataclass
@@ -79,6 +104,14 @@ class PipelineConfig:
     claude_model: str = "sonnet"
     claude_model_verify: str = "haiku"
 
+    # Field names accepted by resolve(); set once below the class body
+    _KNOWN_FIELDS: ClassVar[frozenset[str]]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached TOML parses (e.g. between tests)."""
+        _TOML_CACHE.clear()
+
     @staticmethod
     def from_pyproject(root: Path | None = None) -> dict[str, object]:
         """Read [tool.agentic-dev-pipeline] from pyproject.toml."""
@@ -101,9 +134,10 @@ class PipelineConfig:
     @staticmethod
     def from_env() -> dict[str, object]:
         """Read config from environment variables."""
+        env = os.environ
         result: dict[str, object] = {}
-        for env_key, field_name in _ENV_MAP.items():
-            val = os.environ.get(env_key)
+        for env_key, field_name in _ENV_ITEMS:
+            val = env.get(env_key)
             if val is not None:
                 result[field_name] = _coerce(field_name, val)
         return result
@@ -118,21 +152,16 @@ class PipelineConfig:
         """
         root = project_root or Path.cwd()
 
-        # Collect layers (lowest priority first)
-        env_layer = cls.from_env()
-        file_layer = cls.from_file(root)
-        pyproject_layer = cls.from_pyproject(root)
-        explicit_layer = explicit or {}
+        known = cls._KNOWN_FIELDS
+
+        # Layers lowest priority first; later values override earlier ones.
+        # None never overrides, and unknown keys (e.g. parallel-gates) are dropped.
+        layers = (cls.from_env(), cls.from_file(root), cls.from_pyproject(root), explicit or {})
+        merged = {
+            k: v for layer in layers for k, v in layer.items() if v is not None and k in known
+        }
 
-        # Merge: later dict values override earlier
-        merged: dict[str, object] = {}
-        for layer in (env_layer, file_layer, pyproject_layer, explicit_layer):
-            for k, v in layer.items():
-                if v is not None:
-                    merged[k] = v
+        return cls(**merged)
 
-        # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in merged.items() if k in known}
 
-        return cls(**filtered)
+PipelineConfig._KNOWN_FIELDS = frozenset(f.name for f in fields(PipelineConfig))
@@ -1,26 +1,122 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
 import shutil
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Read once at import: _debug runs on every probe, and with DEBUG unset it
+# should cost a single global lookup.
+_DEBUG = bool(os.environ.get("DEBUG"))
+
 
 def _debug(msg: str) -> None:
-    if os.environ.get("DEBUG"):
+    if _DEBUG:
         print(f"[detect:debug] {msg}", file=sys.stderr)
 
 
+@functools.lru_cache(maxsize=32)
+def _split_env(value: str) -> tuple[str, ...]:
+    """Whitespace-separated words of an env override, split once per distinct value."""
+    return tuple(value.split())
+
+
+@dataclass(slots=True)
+class _StatCache:
+    """One os.stat per path for the lifetime of a detect_all call.
+
+    The detectors probe the same markers (pyproject.toml, package.json,
+    Makefile, uv.lock, src/, tests/ ...) repeatedly; missing paths are cached
+    as None so they are not re-probed either. prime() lists a directory once
+    so that probes of its direct children are answered from the listing.
+
+    Shared across detect_all's worker threads without a lock: entries are
+    only ever added, and two threads missing the same path at once merely
+    stat it twice and store equal results.
+    """
+
+    _entries: dict[Path, os.stat_result | None] = field(default_factory=dict)
+    _listings: dict[Path, dict[str, os.DirEntry[str]]] = field(default_factory=dict)
+
+    def prime(self, directory: Path) -> None:
+        """List *directory* with one os.scandir; later child probes skip stat."""
+        try:
+            with os.scandir(directory) as it:
+                self._listings[directory] = {e.name: e for e in it}
+        except OSError:
+            pass
+
+    def stat(self, path: Path) -> os.stat_result | None:
+        try:
+            return self._entries[path]
+        except KeyError:
+            pass
+        listing = self._listings.get(path.parent)
+        if listing is not None and path.name not in listing:
+            st: os.stat_result | None = None
+        else:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+        self._entries[path] = st
+        return st
+
+    def has_file(self, directory: Path, name: str) -> bool:
+        """is_file(directory / name), without building the child Path when primed."""
+        listing = self._listings.get(directory)
+        if listing is not None:
+            entry = listing.get(name)
+            return entry is not None and entry.is_file()
+        return self.is_file(directory / name)
+
+    def has_dir(self, directory: Path, name: str) -> bool:
+        """is_dir(directory / name), without building the child Path when primed."""
+        listing = self._listings.get(directory)
+        if listing is not None:
+            entry = listing.get(name)
+            return entry is not None and entry.is_dir()
+        return self.is_dir(directory / name)
+
+    def is_file(self, path: Path) -> bool:
+        listing = self._listings.get(path.parent)
+        if listing is not None:
+            entry = listing.get(path.name)
+            return entry is not None and entry.is_file()
+        st = self.stat(path)
+        return st is not None and stat.S_ISREG(st.st_mode)
+
+    def is_dir(self, path: Path) -> bool:
+        listing = self._listings.get(path.parent)
+        if listing is not None:
+            entry = listing.get(path.name)
+            return entry is not None and entry.is_dir()
+        st = self.stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+
 def _resolve_cmd(cmd: str) -> str | None:
-    """Resolve command. PATH에서 찾으면 bare name, venv에서 찾으면 full path, 없으면 None."""
-    if shutil.which(cmd):
+    """Resolve command. PATH에서 찾으면 bare name, venv에서 찾으면 full path, 없으면 None.
+
+    Memoized per (cmd, PATH, sys.prefix, sys.base_prefix), so a changed PATH or
+    venv gets a fresh lookup instead of a stale answer.
+    """
+    return _resolve_cmd_cached(cmd, os.environ.get("PATH"), sys.prefix, sys.base_prefix)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cmd_cached(cmd: str, path: str | None, prefix: str, base_prefix: str) -> str | None:
+    if shutil.which(cmd, path=path):
         return cmd
-    if sys.prefix != sys.base_prefix:
-        venv_path = Path(sys.prefix) / "bin" / cmd
+    if prefix != base_prefix:
+        venv_path = Path(prefix) / "bin" / cmd
         if venv_path.is_file():
             _debug(f"_resolve_cmd({cmd}) → {venv_path} (venv)")
             return str(venv_path)
@@ -33,42 +129,83 @@ def _cmd_exists(cmd: str) -> bool:
     return exists
 
 
-def _has_makefile_target(target: str, project_root: Path | None = None) -> bool:
-    makefile = (project_root or Path.cwd()) / "Makefile"
-    if not makefile.is_file():
-        return False
+# A rule line: target name at column 0 followed by ':' (recipes start with a tab).
+# Matched on the raw bytes so the Makefile is never decoded as a whole.
+_MAKE_TARGET_RE = re.compile(rb"^([^\s:#]+):", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_makefile_targets(path: Path, mtime_ns: int) -> frozenset[str]:
+    """All target names in a Makefile, parsed once per (path, mtime)."""
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return frozenset()
+    return frozenset(
+        name.decode("utf-8", "replace") for name in _MAKE_TARGET_RE.findall(content)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _load_npm_scripts(path: Path, mtime_ns: int) -> frozenset[str]:
+    """Script names in package.json, parsed once per (path, mtime)."""
     try:
-        content = makefile.read_text()
-        found = bool(re.search(rf"^{re.escape(target)}:", content, re.MULTILINE))
-        _debug(f"_has_makefile_target({target}) → {found}")
-        return found
+        raw = path.read_bytes()
     except OSError:
+        return frozenset()
+    if b'"scripts"' not in raw:  # no scripts section: skip the JSON parse entirely
+        return frozenset()
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return frozenset()
+    scripts = data.get("scripts") if isinstance(data, dict) else None
+    return frozenset(scripts) if isinstance(scripts, dict) else frozenset()
+
+
+def _has_makefile_target(
+    target: str, project_root: Path | None = None, stats: _StatCache | None = None
+) -> bool:
+    makefile = (project_root or Path.cwd()) / "Makefile"
+    fs = stats or _StatCache()
+    if not fs.is_file(makefile):
         return False
+    st = fs.stat(makefile)
+    found = st is not None and target in _load_makefile_targets(makefile, st.st_mtime_ns)
+    _debug(f"_has_makefile_target({target}) → {found}")
+    return found
 
 
-def _has_npm_script(script: str, project_root: Path | None = None) -> bool:
+def _has_npm_script(
+    script: str, project_root: Path | None = None, stats: _StatCache | None = None
+) -> bool:
     pkg_json = (project_root or Path.cwd()) / "package.json"
-    if not pkg_json.is_file():
-        return False
-    try:
-        data = json.loads(pkg_json.read_text())
-        found = script in data.get("scripts", {})
-        _debug(f"_has_npm_script({script}) → {found}")
-        return found
-    except (OSError, json.JSONDecodeError):
+    fs = stats or _StatCache()
+    if not fs.is_file(pkg_json):
         return False
+    st = fs.stat(pkg_json)
+    found = st is not None and script in _load_npm_scripts(pkg_json, st.st_mtime_ns)
+    _debug(f"_has_npm_script({script}) → {found}")
+    return found
 
 
-def _python_runner(project_root: Path | None = None) -> str:
+def _python_runner(project_root: Path | None = None, stats: _StatCache | None = None) -> str:
     root = project_root or Path.cwd()
-    if (root / "uv.lock").is_file() and _cmd_exists("uv"):
+    fs = stats or _StatCache()
+    if fs.has_file(root, "uv.lock") and _cmd_exists("uv"):
         return "uv run"
-    if (root / "poetry.lock").is_file() and _cmd_exists("poetry"):
+    if fs.has_file(root, "poetry.lock") and _cmd_exists("poetry"):
         return "poetry run"
     return ""
 
 
-@dataclass
+# Marker and candidate names probed directly under the project root
+_PY_MARKERS = ("pyproject.toml", "setup.py", "setup.cfg")
+_SRC_DIR_CANDIDATES = ("src", "app", "lib", "pkg")
+_INSTRUCTION_CANDIDATES = ("CLAUDE.md", "convention.md", "CONTRIBUTING.md")
+
+
+@dataclass(slots=True)
 class ProjectConfig:
     """Detected project configuration."""
 
@@ -98,21 +235,28 @@ class ProjectConfig:
         return "\n".join(lines)
 
 
-def detect_project_type(project_root: Path | None = None) -> str:
+def detect_project_type(
+    project_root: Path | None = None, stats: _StatCache | None = None
+) -> str:
     """Detect project type from marker files. Returns: python, node, rust, go, or unknown."""
     if env_val := os.environ.get("PROJECT_TYPE"):
         _debug(f"PROJECT_TYPE from env: {env_val}")
         return env_val
 
     root = project_root or Path.cwd()
+    fs = stats
+    if fs is None:
+        # Standalone call: one directory listing answers all six marker probes
+        fs = _StatCache()
+        fs.prime(root)
 
-    if any((root / f).is_file() for f in ("pyproject.toml", "setup.py", "setup.cfg")):
+    if any(fs.has_file(root, f) for f in _PY_MARKERS):
         result = "python"
-    elif (root / "package.json").is_file():
+    elif fs.has_file(root, "package.json"):
         result = "node"
-    elif (root / "Cargo.toml").is_file():
+    elif fs.has_file(root, "Cargo.toml"):
         result = "rust"
-    elif (root / "go.mod").is_file():
+    elif fs.has_file(root, "go.mod"):
         result = "go"
     else:
         result = "unknown"
@@ -121,21 +265,25 @@ def detect_project_type(project_root: Path | None = None) -> str:
     return result
 
 
-def detect_src_dirs(project_root: Path | None = None) -> str:
+def detect_src_dirs(project_root: Path | None = None, stats: _StatCache | None = None) -> str:
     """Detect source directories. Returns space-separated directory list."""
     if env_val := os.environ.get("SRC_DIRS"):
         _debug(f"SRC_DIRS from env: {env_val}")
         return env_val
 
     root = project_root or Path.cwd()
-    dirs = [f"{d}/" for d in ("src", "app", "lib", "pkg") if (root / d).is_dir()]
+    fs = stats or _StatCache()
+    dirs = [f"{d}/" for d in _SRC_DIR_CANDIDATES if fs.has_dir(root, d)]
     result = " ".join(dirs) if dirs else "."
     _debug(f"detect_src_dirs → {result}")
     return result
 
 
 def detect_lint_cmd(
-    project_type: str | None = None, src_dirs: str | None = None, project_root: Path | None = None
+    project_type: str | None = None,
+    src_dirs: str | None = None,
+    project_root: Path | None = None,
+    stats: _StatCache | None = None,
 ) -> str:
     """Detect lint command. Returns command string or empty if none found."""
     if env_val := os.environ.get("LINT_CMD"):
@@ -143,21 +291,22 @@ def detect_lint_cmd(
         return env_val
 
     root = project_root or Path.cwd()
-    ptype = project_type or detect_project_type(root)
-    sdirs = src_dirs or detect_src_dirs(root)
+    fs = stats or _StatCache()
+    ptype = project_type or detect_project_type(root, fs)
+    sdirs = src_dirs or detect_src_dirs(root, fs)
 
     # 1. Makefile target
-    if _has_makefile_target("lint", root):
+    if _has_makefile_target("lint", root, fs):
         _debug("detect_lint_cmd → make lint (Makefile)")
         return "make lint"
 
     # 2. npm script
-    if ptype == "node" and _has_npm_script("lint", root):
+    if ptype == "node" and _has_npm_script("lint", root, fs):
         _debug("detect_lint_cmd → npm run lint (npm script)")
         return "npm run lint"
 
     # 3. Tool existence by project type
-    runner = _python_runner(root)
+    runner = _python_runner(root, fs)
 
     if ptype == "python":
         resolved = _resolve_cmd("ruff")
@@ -189,27 +338,32 @@ def detect_lint_cmd(
     return ""
 
 
-def detect_test_cmd(project_type: str | None = None, project_root: Path | None = None) -> str:
+def detect_test_cmd(
+    project_type: str | None = None,
+    project_root: Path | None = None,
+    stats: _StatCache | None = None,
+) -> str:
     """Detect test command. Returns command string or empty if none found."""
     if env_val := os.environ.get("TEST_CMD"):
         _debug(f"TEST_CMD from env: {env_val}")
         return env_val
 
     root = project_root or Path.cwd()
-    ptype = project_type or detect_project_type(root)
+    fs = stats or _StatCache()
+    ptype = project_type or detect_project_type(root, fs)
 
     # 1. Makefile target
-    if _has_makefile_target("test", root):
+    if _has_makefile_target("test", root, fs):
         _debug("detect_test_cmd → make test (Makefile)")
         return "make test"
 
     # 2. npm script
-    if ptype == "node" and _has_npm_script("test", root):
+    if ptype == "node" and _has_npm_script("test", root, fs):
         _debug("detect_test_cmd → npm test (npm script)")
         return "npm test"
 
     # 3. Tool existence by project type
-    runner = _python_runner(root)
+    runner = _python_runner(root, fs)
 
     if ptype == "python":
         resolved = _resolve_cmd("pytest")
@@ -217,7 +371,7 @@ def detect_test_cmd(project_type: str | None = None, project_root: Path | None =
             if runner:
                 return f"{runner} pytest -q"
             return f"{resolved} -q"
-        if (root / "tests").is_dir() or (root / "test").is_dir():
+        if fs.has_dir(root, "tests") or fs.has_dir(root, "test"):
             prefix = f"{runner} " if runner else ""
             return f"{prefix}python -m unittest discover"
     elif ptype == "node":
@@ -235,7 +389,10 @@ def detect_test_cmd(project_type: str | None = None, project_root: Path | None =
 
 
 def detect_security_cmd(
-    project_type: str | None = None, src_dirs: str | None = None, project_root: Path | None = None
+    project_type: str | None = None,
+    src_dirs: str | None = None,
+    project_root: Path | None = None,
+    stats: _StatCache | None = None,
 ) -> str:
     """Detect security scan command. Returns command string or empty if none found."""
     # Allow explicit empty override to skip
@@ -245,8 +402,9 @@ def detect_security_cmd(
         return env_val
 
     root = project_root or Path.cwd()
-    ptype = project_type or detect_project_type(root)
-    sdirs = src_dirs or detect_src_dirs(root)
+    fs = stats or _StatCache()
+    ptype = project_type or detect_project_type(root, fs)
+    sdirs = src_dirs or detect_src_dirs(root, fs)
 
     # 1. semgrep (works for most languages)
     semgrep = _resolve_cmd("semgrep")
@@ -255,7 +413,7 @@ def detect_security_cmd(
 
     # 2. Language-specific fallbacks
     if ptype == "python":
-        runner = _python_runner(root)
+        runner = _python_runner(root, fs)
         resolved = _resolve_cmd("bandit")
         if resolved:
             if runner:
@@ -273,61 +431,85 @@ def detect_security_cmd(
     return ""
 
 
-def detect_instruction_files(project_root: Path | None = None) -> list[str]:
+def detect_instruction_files(
+    project_root: Path | None = None, stats: _StatCache | None = None
+) -> list[str]:
     """Detect project instruction/convention files."""
     if env_val := os.environ.get("INSTRUCTION_FILES"):
-        return env_val.split()
+        return list(_split_env(env_val))
 
     root = project_root or Path.cwd()
+    fs = stats or _StatCache()
     files: list[str] = []
     seen: set[str] = set()
 
     # Static candidates
-    for name in ("CLAUDE.md", "convention.md", "CONTRIBUTING.md"):
-        path = root / name
-        if path.is_file() and name not in seen:
+    for name in _INSTRUCTION_CANDIDATES:
+        if fs.has_file(root, name) and name not in seen:
             files.append(name)
             seen.add(name)
 
-    # Glob: .claude/rules/*.md
-    rules_dir = root / ".claude" / "rules"
-    if rules_dir.is_dir():
-        for match in sorted(rules_dir.glob("*.md")):
-            rel = str(match.relative_to(root))
-            if rel not in seen:
-                files.append(rel)
-                seen.add(rel)
+    # .claude/rules/*.md: one scandir, whose entries carry their own type, and
+    # no separate existence check for the directory
+    rules_rel = os.path.join(".claude", "rules")
+    try:
+        with os.scandir(root / rules_rel) as it:
+            rules = sorted(e.name for e in it if e.name.endswith(".md") and e.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        rules = []
+    for name in rules:
+        rel = os.path.join(rules_rel, name)
+        if rel not in seen:
+            files.append(rel)
+            seen.add(rel)
 
     _debug(f"detect_instruction_files → {files}")
     return files
 
 
-def detect_design_docs(project_root: Path | None = None) -> list[str]:
+def detect_design_docs(
+    project_root: Path | None = None, stats: _StatCache | None = None
+) -> list[str]:
     """Detect architecture/design documentation files."""
     if env_val := os.environ.get("DESIGN_DOCS"):
-        return env_val.split()
+        return list(_split_env(env_val))
 
     root = project_root or Path.cwd()
+    fs = stats or _StatCache()
     candidates = [
         "docs/design-doc.md",
         "docs/architecture.md",
         "docs/design.md",
         "ARCHITECTURE.md",
     ]
-    files = [f for f in candidates if (root / f).is_file()]
+    files = [f for f in candidates if fs.is_file(root / f)]
     _debug(f"detect_design_docs → {files}")
     return files
 
 
+# Fallback source extensions per project type, and directories never walked
+_SOURCE_EXTS: dict[str, frozenset[str]] = {
+    "python": frozenset({".py"}),
+    "node": frozenset({".ts", ".tsx", ".js", ".jsx"}),
+    "rust": frozenset({".rs"}),
+    "go": frozenset({".go"}),
+}
+_DEFAULT_SOURCE_EXTS = frozenset({".py", ".ts", ".js", ".rs", ".go"})
+_EXCLUDED_DIRS = frozenset({"node_modules", ".venv", "target", "__pycache__"})
+
+
 def detect_changed_files(
-    base_branch: str = "main", project_type: str | None = None, project_root: Path | None = None
+    base_branch: str = "main",
+    project_type: str | None = None,
+    project_root: Path | None = None,
+    stats: _StatCache | None = None,
 ) -> list[str]:
     """Detect files changed in current branch vs base. Returns deduplicated sorted list."""
     if env_val := os.environ.get("CHANGED_FILES"):
-        return env_val.split()
+        return list(_split_env(env_val))
 
     root = project_root or Path.cwd()
-    ptype = project_type or detect_project_type(root)
+    ptype = project_type or detect_project_type(root, stats)
 
     def _git(*args: str) -> list[str]:
         try:
@@ -342,35 +524,39 @@ def detect_changed_files(
         except (subprocess.SubprocessError, FileNotFoundError):
             return []
 
-    # Collect from all sources
-    committed = _git("diff", "--name-only", f"{base_branch}..HEAD")
-    staged = _git("diff", "--name-only", "--cached")
-    unstaged = _git("diff", "--name-only", "HEAD")
-    untracked = _git("ls-files", "--others", "--exclude-standard")
-
-    # Merge and deduplicate
-    all_files = sorted(set(committed + staged + unstaged + untracked))
-
-    # Fallback: find source files by extension
+    # Collect from all sources. The queries are independent, so run them
+    # concurrently; outside a work tree skip git entirely.
+    all_files: list[str] = []
+    if _git("rev-parse", "--is-inside-work-tree") == ["true"]:
+        queries = (
+            ("diff", "--name-only", f"{base_branch}..HEAD"),  # committed
+            ("diff", "--name-only", "--cached"),  # staged
+            ("diff", "--name-only", "HEAD"),  # unstaged
+            ("ls-files", "--others", "--exclude-standard"),  # untracked
+        )
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            results = list(executor.map(lambda args: _git(*args), queries))
+
+        # Merge and deduplicate (sorted for deterministic prompts), without
+        # concatenating the per-query lists first
+        all_files = sorted(set().union(*results))
+
+    # Fallback: find source files by extension, in one pruned walk
     if not all_files:
-        ext_map = {
-            "python": ["*.py"],
-            "node": ["*.ts", "*.tsx", "*.js", "*.jsx"],
-            "rust": ["*.rs"],
-            "go": ["*.go"],
-        }
-        patterns = ext_map.get(ptype, ["*.py", "*.ts", "*.js", "*.rs", "*.go"])
+        exts = _SOURCE_EXTS.get(ptype, _DEFAULT_SOURCE_EXTS)
         found: list[str] = []
-        for pattern in patterns:
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Prune in place so excluded trees are never descended into
+            dirnames[:] = sorted(d for d in dirnames if d not in _EXCLUDED_DIRS)
+            rel_dir = os.path.relpath(dirpath, root)
             found.extend(
-                str(p.relative_to(root))
-                for p in root.rglob(pattern)
-                if not any(
-                    part in p.parts
-                    for part in ("node_modules", ".venv", "target", "__pycache__")
-                )
+                name if rel_dir == os.curdir else os.path.join(rel_dir, name)
+                for name in sorted(filenames)
+                if os.path.splitext(name)[1] in exts
             )
-        all_files = sorted(set(found))[:200]
+            if len(found) >= 200:
+                break
+        all_files = sorted(found[:200])
 
     if not all_files:
         all_files = ["No changed files detected"]
@@ -386,17 +572,30 @@ def detect_all(
     root = project_root or Path.cwd()
     branch = base_branch or os.environ.get("BASE_BRANCH", "main")
 
-    ptype = detect_project_type(root)
-    sdirs = detect_src_dirs(root)
-
-    return ProjectConfig(
-        project_type=ptype,
-        src_dirs=sdirs,
-        lint_cmd=detect_lint_cmd(ptype, sdirs, root),
-        test_cmd=detect_test_cmd(ptype, root),
-        security_cmd=detect_security_cmd(ptype, sdirs, root),
-        instruction_files=detect_instruction_files(root),
-        design_docs=detect_design_docs(root),
-        changed_files=detect_changed_files(branch, ptype, root),
-        base_branch=branch,
-    )
+    fs = _StatCache()  # shared by every detector below
+    fs.prime(root)  # one scandir answers every root-level marker probe
+
+    ptype = detect_project_type(root, fs)
+    sdirs = detect_src_dirs(root, fs)
+
+    # The remaining detectors only depend on ptype/sdirs and are I/O bound
+    # (stat, file reads, git), so run them concurrently.
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        lint = executor.submit(detect_lint_cmd, ptype, sdirs, root, fs)
+        test = executor.submit(detect_test_cmd, ptype, root, fs)
+        security = executor.submit(detect_security_cmd, ptype, sdirs, root, fs)
+        instructions = executor.submit(detect_instruction_files, root, fs)
+        docs = executor.submit(detect_design_docs, root, fs)
+        changed = executor.submit(detect_changed_files, branch, ptype, root, fs)
+
+        return ProjectConfig(
+            project_type=ptype,
+            src_dirs=sdirs,
+            lint_cmd=lint.result(),
+            test_cmd=test.result(),
+            security_cmd=security.result(),
+            instruction_files=instructions.result(),
+            design_docs=docs.result(),
+            changed_files=changed.result(),
+            base_branch=branch,
+        )
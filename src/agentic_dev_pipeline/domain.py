@@ -7,14 +7,14 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
-class GateStatus(enum.Enum):
+class GateStatus(enum.StrEnum):
     PASS = "pass"
     FAIL = "fail"
     SKIPPED = "skipped"
     BLOCKED = "blocked"
 
 
-class IterationOutcome(enum.Enum):
+class IterationOutcome(enum.StrEnum):
     PASS = "pass"
     GATE_FAIL = "gate_fail"
     VERIFY_FAIL = "verify_fail"
@@ -25,7 +25,22 @@ TRIANGULAR_PASS_MARKER = "TRIANGULAR_PASS"
 GateFunction = Callable[[], tuple[bool, str]]
 
 
-@dataclass
+def sequential_gate(func: GateFunction) -> GateFunction:
+    """Mark a gate with side effects so parallel runs execute it on its own.
+
+    Usage:
+        @sequential_gate
+        def migrations_apply() -> tuple[bool, str]: ...
+    """
+    func._sequential_gate = True  # type: ignore[attr-defined]
+    return func
+
+
+def is_sequential_gate(func: GateFunction) -> bool:
+    return getattr(func, "_sequential_gate", False)
+
+
+@dataclass(slots=True)
 class GateResult:
     name: str = ""
     status: GateStatus = GateStatus.SKIPPED
@@ -33,7 +48,11 @@ class GateResult:
     duration_s: float = 0.0
 
 
-@dataclass
+# Gates reported in their own IterationMetrics fields; the rest are plugins
+_CORE_GATES = frozenset({"lint", "test", "security"})
+
+
+@dataclass(slots=True)
 class IterationMetrics:
     iteration: int = 0
     duration_s: float = 0.0
@@ -64,7 +83,7 @@ class IterationMetrics:
                 "duration_s": g.duration_s,
             }
             for g in self.gate_results
-            if g.name not in ("lint", "test", "security")
+            if g.name not in _CORE_GATES
         ]
 
     @property
@@ -72,26 +91,32 @@ class IterationMetrics:
         return self.verification_status.value
 
     def to_dict(self) -> dict[str, object]:
+        index = self._gate_index()
         return {
             "iteration": self.iteration,
             "duration_s": self.duration_s,
             "phase1_done": self.phase1_done,
-            "lint_result": self.lint_result,
-            "test_result": self.test_result,
-            "security_result": self.security_result,
+            "lint_result": self._gate_status("lint", index),
+            "test_result": self._gate_status("test", index),
+            "security_result": self._gate_status("security", index),
             "plugin_results": self.plugin_results,
             "verification_result": self.verification_result,
             "outcome": self.outcome.value if self.outcome else "",
         }
 
-    def _gate_status(self, name: str) -> str:
+    def _gate_index(self) -> dict[str, GateResult]:
+        """Name → first GateResult with that name, built in one pass."""
+        index: dict[str, GateResult] = {}
         for g in self.gate_results:
-            if g.name == name:
-                return g.status.value
-        return GateStatus.SKIPPED.value
+            index.setdefault(g.name, g)
+        return index
+
+    def _gate_status(self, name: str, index: dict[str, GateResult] | None = None) -> str:
+        g = (index if index is not None else self._gate_index()).get(name)
+        return g.status.value if g is not None else GateStatus.SKIPPED.value
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineMetrics:
     started_at: str = ""
     ended_at: str = ""
@@ -112,4 +137,6 @@ class PipelineMetrics:
 
     def save(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False))
+        # Stream the encoding to disk rather than building the whole document first
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import functools
+import os
+import subprocess
+import threading
+import tokenize
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+
+from agentic_dev_pipeline.domain import GateFunction
+
+
+def _git_ls_files(root: str) -> list[str] | None:
+    """Files under *root* that git tracks or would track (honours .gitignore).
+
+    Returns None when *root* is not inside a git work tree or git is missing,
+    so the caller can fall back to walking the directory.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            capture_output=True,
+            cwd=root,
+            timeout=10,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return [os.path.join(root, os.fsdecode(name)) for name in result.stdout.split(b"\0") if name]
+
+
+# Directory names never descended into when walking without git
+_SKIP_DIRS = frozenset({".git", ".venv", "venv", "node_modules", "__pycache__", "target"})
+
+
+def _walk(root: str) -> Iterator[os.DirEntry[str]]:
+    """Yield every file and directory entry under *root*, pruning _SKIP_DIRS.
+
+    Uses an explicit stack of os.scandir iterators; is_dir()/is_file() answer
+    from the directory entry without an extra stat call per file.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                        yield entry
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+# (path relative to base, 1-based line number, line text)
+PatternHit = tuple[str, int, str]
+
+# Hits per pattern/called name, plus the keys whose hits were cut at MAX_MATCHES
+_ScanResult = tuple[dict[bytes | str, list[PatternHit]], set[bytes | str]]
+
+# Hits kept per pattern; a gate pointed at a huge tree reports this many and stops
+MAX_MATCHES = 200
+
+
+def _iter_hits(data: bytes, needle: bytes, rel: str) -> Iterator[PatternHit]:
+    """Yield each line of *data* containing *needle*, one hit per line like grep."""
+    lineno, counted = 1, 0
+    pos = data.find(needle)
+    while pos != -1:
+        lineno += data.count(b"\n", counted, pos)
+        start = data.rfind(b"\n", 0, pos) + 1
+        end = data.find(b"\n", pos)
+        end = len(data) if end == -1 else end
+        yield rel, lineno, data[start:end].decode("utf-8", "replace")
+        counted = pos
+        pos = data.find(needle, end)
+
+
+# Tokens that may sit between a name and its "(" without breaking the call
+_TRIVIA = frozenset({tokenize.NL, tokenize.COMMENT})
+
+
+@functools.lru_cache(maxsize=2048)
+def _call_sites(
+    path: str, mtime_ns: int, size: int, names: frozenset[str]
+) -> tuple[tuple[str, int, str], ...]:
+    """(name, line number, line text) for each call to one of *names* in a Python file.
+
+    Uses tokenize, so mentions inside comments and strings, attribute calls
+    (``obj.print(``) and longer names (``sprint(``) are not counted. Keyed by
+    mtime and size so unchanged files are not re-tokenized across iterations.
+    """
+    sites: list[tuple[str, int, str]] = []
+    try:
+        with open(path, "rb") as f:
+            prev: tokenize.TokenInfo | None = None
+            name_tok: tokenize.TokenInfo | None = None
+            for tok in tokenize.tokenize(f.readline):
+                if tok.type == tokenize.OP and tok.string == "(" and name_tok is not None:
+                    sites.append((name_tok.string, name_tok.start[0], name_tok.line.rstrip("\r\n")))
+                name_tok = None
+                if (
+                    tok.type == tokenize.NAME
+                    and tok.string in names
+                    and not (prev is not None and prev.string in {".", "def"})
+                ):
+                    name_tok = tok
+                if tok.type not in _TRIVIA:
+                    prev = tok
+    except (OSError, SyntaxError, tokenize.TokenError):
+        pass  # unreadable or unparsable: report what was found before the error
+    return tuple(sites)
+
+
+class PatternGateBatch:
+    """Literal-pattern gates answered by one shared scan of the source tree.
+
+    Each file is read once and searched for every pattern registered through
+    gate(). The scan is shared by one round of gate calls: it is redone only
+    when a gate that was already answered from it is called again, so N
+    pattern gates cost one tree walk per pipeline iteration instead of N.
+    Gates may be called from several threads at once (--parallel-gates); the
+    first caller of a round scans and the others wait for its result. Inside
+    a git work tree only files git would track are scanned, so ignored
+    directories such as .venv/ never produce matches.
+
+    call_gate() registers a Python function name instead of a literal; it is
+    matched with tokenize, so comments, strings and look-alike names such as
+    sprint() do not trip it.
+
+    Usage:
+        batch = PatternGateBatch([Path("src")])
+        no_todos = batch.gate("TODO")
+        no_print = batch.call_gate("print")
+    """
+
+    def __init__(self, roots: Iterable[str | Path], base: str | Path | None = None) -> None:
+        self._roots = [str(r) for r in roots]
+        self._base = str(base) if base is not None else os.curdir
+        self._patterns: dict[bytes, None] = {}
+        self._calls: dict[str, None] = {}
+        self._lock = threading.Lock()
+        # Current round's (hits, truncated keys) and the keys already answered from it
+        self._cached: _ScanResult | None = None
+        self._served: set[bytes | str] = set()
+
+    def gate(self, pattern: str | bytes) -> GateFunction:
+        """Register a literal pattern. The returned gate fails if it occurs anywhere."""
+        needle = pattern.encode() if isinstance(pattern, str) else pattern
+        if not needle:
+            raise ValueError("pattern must not be empty")
+        self._patterns[needle] = None
+        self._cached = None
+        return self._make_gate(needle, repr(needle.decode("utf-8", "replace")))
+
+    def call_gate(self, name: str) -> GateFunction:
+        """Register a function name. The returned gate fails if any .py file calls it."""
+        if not name.isidentifier():
+            raise ValueError(f"not a Python identifier: {name!r}")
+        self._calls[name] = None
+        self._cached = None
+        return self._make_gate(name, f"call to {name}()")
+
+    def _make_gate(self, key: bytes | str, label: str) -> GateFunction:
+        def _gate() -> tuple[bool, str]:
+            with self._lock:
+                if self._cached is None or key in self._served:
+                    self._cached = self._scan()
+                    self._served = set()
+                self._served.add(key)
+                all_hits, truncated = self._cached
+            hits = all_hits[key]
+            if hits:
+                lines = "\n".join(f"{path}:{lineno}:{line}" for path, lineno, line in hits)
+                if key in truncated:
+                    lines += f"\n… (truncated after {MAX_MATCHES} matches)"
+                return False, f"Found {label}:\n{lines}"
+            return True, f"No {label} found"
+
+        return _gate
+
+    def scan(self) -> dict[bytes | str, list[PatternHit]]:
+        """Return up to MAX_MATCHES hits per pattern (bytes keys) and called name (str keys).
+
+        Always scans afresh; the result also starts a new round for the gates.
+        """
+        with self._lock:
+            self._cached = self._scan()
+            self._served = set()
+            return self._cached[0]
+
+    def _files(self) -> Iterable[str]:
+        for root in self._roots:
+            tracked = _git_ls_files(root)
+            if tracked is not None:
+                yield from tracked
+                continue
+            yield from (e.path for e in _walk(root) if e.is_file(follow_symlinks=False))
+
+    def _scan(self) -> _ScanResult:
+        needles: tuple[bytes, ...] = tuple(self._patterns)
+        calls: frozenset[str] = frozenset(self._calls)
+        hits: dict[bytes | str, list[PatternHit]] = {k: [] for k in needles}
+        hits.update((name, []) for name in self._calls)
+        truncated: set[bytes | str] = set()
+        if not hits:
+            return hits, truncated
+
+        def _add(key: bytes | str, found_iter: Iterable[PatternHit]) -> None:
+            found = hits[key]
+            # Take one past the cap so we know whether anything was dropped
+            found.extend(islice(found_iter, MAX_MATCHES + 1 - len(found)))
+            if len(found) > MAX_MATCHES:
+                del found[MAX_MATCHES:]
+                truncated.add(key)
+
+        for path in self._files():
+            open_needles = [n for n in needles if n not in truncated]
+            open_calls = calls.difference(truncated)
+            if not open_needles and not open_calls:
+                break  # every gate is capped, the rest of the tree cannot change the result
+            rel = os.path.relpath(path, self._base)
+
+            if open_calls and path.endswith(".py"):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                sites = _call_sites(path, st.st_mtime_ns, st.st_size, calls)
+                for name in open_calls:
+                    _add(name, ((rel, ln, line) for n, ln, line in sites if n == name))
+
+            if not open_needles:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue
+            if b"\0" in data:  # binary file, skipped like grep does
+                continue
+            for needle in open_needles:
+                _add(needle, _iter_hits(data, needle, rel))
+        return hits, truncated
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 _PROMPT_TEMPLATE = """\
@@ -91,42 +92,58 @@ requirements-file = "requirements.md"
 
 _GITIGNORE_ENTRY = ".agentic-dev-pipeline/"
 
+# Byte forms for the append paths below, which work on the raw file contents
+_PYPROJECT_SECTION_BYTES = _PYPROJECT_SECTION.encode()
+_PYPROJECT_HEADER_BYTES = b"[tool.agentic-dev-pipeline]"
+_GITIGNORE_ENTRY_BYTES = _GITIGNORE_ENTRY.encode()
+
 
 def run_init(project_root: Path | None = None, *, force: bool = False) -> list[str]:
     """Scaffold config files. Returns list of actions taken."""
     root = project_root or Path.cwd()
     actions: list[str] = []
 
+    # One directory listing answers every existence check below
+    try:
+        with os.scandir(root) as it:
+            entries = {e.name: e for e in it}
+    except OSError:
+        entries = {}
+
+    def _is_file(name: str) -> bool:
+        entry = entries.get(name)
+        return entry is not None and entry.is_file()
+
     # 1. PROMPT template
     prompt_file = root / "PROMPT.md"
-    if not prompt_file.exists() or force:
+    if prompt_file.name not in entries or force:
         prompt_file.write_text(_PROMPT_TEMPLATE)
-        actions.append(f"Created {prompt_file.relative_to(root)}")
+        actions.append(f"Created {prompt_file.name}")
     else:
-        actions.append(f"Skipped {prompt_file.relative_to(root)} (already exists)")
+        actions.append(f"Skipped {prompt_file.name} (already exists)")
 
     # 2. Requirements template
     req_file = root / "requirements.md"
-    if not req_file.exists() or force:
+    if req_file.name not in entries or force:
         req_file.write_text(_REQUIREMENTS_TEMPLATE)
-        actions.append(f"Created {req_file.relative_to(root)}")
+        actions.append(f"Created {req_file.name}")
     else:
-        actions.append(f"Skipped {req_file.relative_to(root)} (already exists)")
+        actions.append(f"Skipped {req_file.name} (already exists)")
 
     # 3. Config: pyproject.toml section or standalone .toml
     pyproject = root / "pyproject.toml"
     standalone = root / ".agentic-dev-pipeline.toml"
 
-    if pyproject.is_file():
-        content = pyproject.read_text()
-        if "[tool.agentic-dev-pipeline]" not in content:
-            with pyproject.open("a") as f:
-                f.write(_PYPROJECT_SECTION)
+    if _is_file(pyproject.name):
+        # Read-only check first: a section already present needs no write access
+        if _PYPROJECT_HEADER_BYTES not in pyproject.read_bytes():
+            with pyproject.open("ab") as f:
+                f.write(_PYPROJECT_SECTION_BYTES)
             actions.append("Added [tool.agentic-dev-pipeline] to pyproject.toml")
         else:
             actions.append("Skipped pyproject.toml (section already exists)")
     else:
-        if not standalone.exists() or force:
+        if standalone.name not in entries or force:
             standalone.write_text(_TOML_CONFIG)
             actions.append(f"Created {standalone.name}")
         else:
@@ -134,13 +151,13 @@ def run_init(project_root: Path | None = None, *, force: bool = False) -> list[s
 
     # 4. .gitignore
     gitignore = root / ".gitignore"
-    if gitignore.is_file():
-        content = gitignore.read_text()
-        if _GITIGNORE_ENTRY not in content:
-            with gitignore.open("a") as f:
-                if not content.endswith("\n"):
-                    f.write("\n")
-                f.write(f"{_GITIGNORE_ENTRY}\n")
+    if _is_file(gitignore.name):
+        content = gitignore.read_bytes()
+        if _GITIGNORE_ENTRY_BYTES not in content:
+            with gitignore.open("ab") as f:
+                if not content.endswith(b"\n"):
+                    f.write(b"\n")
+                f.write(_GITIGNORE_ENTRY_BYTES + b"\n")
             actions.append(f"Added {_GITIGNORE_ENTRY} to .gitignore")
         else:
             actions.append("Skipped .gitignore (entry already exists)")
@@ -5,18 +5,28 @@ import os
 import sys
 import time
 from pathlib import Path
+from types import TracebackType
+from typing import IO
+
+# One encoder for every JSON record: json.dumps() with non-default options
+# builds a fresh JSONEncoder per call.
+_encode = json.JSONEncoder(ensure_ascii=False).encode
 
 
 class Logger:
     """Pipeline logger with text and JSON Lines modes.
 
-    Writes to both stdout and an optional log file.
+    Writes to both stdout and an optional log file. The file is opened on the
+    first write and kept open until close(); a closed Logger reopens it if used
+    again. File writes are block-buffered and flushed on phase_end(), on
+    warn()/error(), on flush() and on close(), so a chatty phase costs a
+    handful of write() calls rather than one per line.
 
     Usage:
-        logger = Logger(log_file=Path("output/loop-execution.log"))
-        logger.info("Pipeline started")
-        logger.phase_start("quality_gates", iteration=1)
-        logger.phase_end("quality_gates", iteration=1, result="pass")
+        with Logger(log_file=Path("output/loop-execution.log")) as logger:
+            logger.info("Pipeline started")
+            logger.phase_start("quality_gates", iteration=1)
+            logger.phase_end("quality_gates", iteration=1, result="pass")
     """
 
     def __init__(self, log_file: Path | None = None, json_mode: bool | None = None) -> None:
@@ -25,18 +35,48 @@ class Logger:
             os.environ.get("LOG_FORMAT", "").lower() == "json"
         )
         self._start_time = time.time()
+        self._fp: IO[str] | None = None
+        # Formatted timestamps for the current wall-clock second, reused by
+        # every line emitted within it
+        self._last_sec = -1
+        self._ts_json = ""
+        self._ts_text = ""
 
         if log_file:
             log_file.parent.mkdir(parents=True, exist_ok=True)
 
+    def flush(self) -> None:
+        """Write buffered log lines through to the log file."""
+        if self._fp is not None:
+            self._fp.flush()
+
+    def close(self) -> None:
+        """Close the log file handle, if open."""
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def __enter__(self) -> Logger:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
     def info(self, message: str, **extra: object) -> None:
         self._emit("info", message, **extra)
 
     def warn(self, message: str, **extra: object) -> None:
         self._emit("warn", message, **extra)
+        self.flush()
 
     def error(self, message: str, **extra: object) -> None:
         self._emit("error", message, **extra)
+        self.flush()
 
     def phase_start(self, phase: str, **extra: object) -> None:
         self._emit("info", f"[{phase}] Started", phase=phase, event="phase_start", **extra)
@@ -50,23 +90,32 @@ class Logger:
             result=result,
             **extra,
         )
+        self.flush()
 
     def _emit(self, level: str, message: str, **extra: object) -> None:
+        now = time.time()
+        sec = int(now)
+        if sec != self._last_sec:
+            local = time.localtime(sec)
+            self._ts_json = time.strftime("%Y-%m-%dT%H:%M:%S%z", local)
+            self._ts_text = time.strftime("%H:%M:%S", local)
+            self._last_sec = sec
+
         if self._json_mode:
             record = {
-                "ts": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
-                "elapsed_s": round(time.time() - self._start_time, 2),
+                "ts": self._ts_json,
+                "elapsed_s": round(now - self._start_time, 2),
                 "level": level,
                 "msg": message,
                 **extra,
             }
-            line = json.dumps(record, ensure_ascii=False)
+            line = _encode(record)
         else:
-            ts = time.strftime("%H:%M:%S")
-            line = f"[{ts}] {message}"
+            line = f"[{self._ts_text}] {message}"
 
         print(line, file=sys.stderr if level == "warn" else sys.stdout)
 
         if self._log_file:
-            with self._log_file.open("a") as f:
-                f.write(line + "\n")
+            if self._fp is None:
+                self._fp = self._log_file.open("a")
+            self._fp.write(line + "\n")
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import http.client
+import inspect
 import json
 import os
 import re
+import shlex
 import shutil
 import signal
 import subprocess
+import threading
 import time
+import urllib.parse
 import urllib.request
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
+from typing import TypeGuard
 
 from agentic_dev_pipeline.detect import ProjectConfig, detect_all
 from agentic_dev_pipeline.domain import (
@@ -19,38 +28,79 @@ from agentic_dev_pipeline.domain import (
     IterationMetrics,
     IterationOutcome,
     PipelineMetrics,
+    is_sequential_gate,
 )
 from agentic_dev_pipeline.log import Logger
-from agentic_dev_pipeline.runner import ClaudeRunner, CliClaudeRunner
-from agentic_dev_pipeline.verify import run_triangular_verification
+from agentic_dev_pipeline.runner import ClaudeRunner, CliClaudeRunner, _SinkClaudeRunner
+from agentic_dev_pipeline.verify import _triangular_verification
 
 _GATE_OUTPUT_LIMIT = 500
+_ISO_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 
 _UNSAFE_PATTERN = re.compile(r"\$\(|`|;\s*rm\s|&&\s*rm\s|>\s*/dev/")
 
 
+@functools.lru_cache(maxsize=256)
 def _is_safe_command(cmd: str) -> bool:
-    """Return True if cmd does not contain obvious injection patterns."""
+    """Return True if cmd does not contain obvious injection patterns.
+
+    Memoized: the same gate commands are re-checked on every iteration.
+    """
     return not _UNSAFE_PATTERN.search(cmd)
 
 
+# Anything the shell would interpret beyond word splitting and quoting
+_SHELL_META = re.compile(r"[|&;<>()$`\\*?\[\]{}~#\n]")
+
+
+def _gate_argv(cmd: str) -> list[str] | None:
+    """Split a plain command into argv, or None if it needs a shell.
+
+    Most detected gates ("ruff check src/", "uv run pytest -q", "make lint")
+    are a single program plus arguments; exec'ing them directly skips the
+    /bin/sh hop. Pipes, redirects, globs and env assignments keep going
+    through the shell, as does any first word that is not a program on PATH
+    (builtins and keywords such as "! grep ...", "command -v", "time").
+    """
+    if _SHELL_META.search(cmd):
+        return None
+    try:
+        argv = shlex.split(cmd)
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0] or shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
 def _run_gate_command(cmd: str, timeout: int = 300) -> tuple[bool, str]:
     """Run a quality gate command safely. Returns (passed, output)."""
     if not _is_safe_command(cmd):
         return False, f"BLOCKED: command contains unsafe patterns: {cmd}"
 
+    argv = _gate_argv(cmd)
     try:
         result = subprocess.run(
-            cmd,
-            shell=True,
+            cmd if argv is None else argv,
+            shell=argv is None,
             capture_output=True,
-            text=True,
             timeout=timeout,
         )
-        output = result.stdout + result.stderr
-        return result.returncode == 0, output
+        if result.returncode == 0:
+            # A passing gate's output is only kept as a _GATE_OUTPUT_LIMIT-char
+            # excerpt, so decode just enough bytes for that (UTF-8 is <= 4 per char)
+            limit = _GATE_OUTPUT_LIMIT * 4
+            head = result.stdout[:limit]
+            if len(head) < limit:
+                head += result.stderr[: limit - len(head)]
+            return True, head.decode("utf-8", "replace")[:_GATE_OUTPUT_LIMIT]
+        # Failures feed the full output back to claude. Decode once, tolerantly:
+        # gate tools may emit non-UTF-8 bytes
+        return False, (result.stdout + result.stderr).decode("utf-8", "replace")
     except subprocess.TimeoutExpired:
         return False, f"Command timed out after {timeout}s: {cmd}"
+    except FileNotFoundError:
+        return False, f"Command not found: {cmd}"
     except Exception as e:
         return False, f"Command failed: {e}"
 
@@ -64,16 +114,21 @@ def _load_plugins(plugin_dir: str | None = None) -> list[tuple[str, str]]:
     if not pdir:
         return []
 
-    path = Path(pdir)
-    if not path.is_dir():
+    # One scandir: DirEntry.is_file() is answered from the listing, not a stat
+    try:
+        with os.scandir(Path(pdir)) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:  # missing or not a directory
         return []
 
+    interpreters = {".sh": "bash", ".py": "python3"}
     plugins: list[tuple[str, str]] = []
-    for f in sorted(path.iterdir()):
-        if f.suffix == ".sh" and f.is_file():
-            plugins.append((f.stem, f"bash {f}"))
-        elif f.suffix == ".py" and f.is_file():
-            plugins.append((f.stem, f"python3 {f}"))
+    for entry in entries:
+        stem, suffix = os.path.splitext(entry.name)
+        interpreter = interpreters.get(suffix)
+        if interpreter and entry.is_file():
+            # Quoted, so paths with spaces still split into exactly two argv words
+            plugins.append((stem, shlex.join([interpreter, entry.path])))
     return plugins
 
 
@@ -85,10 +140,88 @@ def _run_callable_gate(name: str, func: Callable[[], tuple[bool, str]]) -> tuple
         return False, f"Gate '{name}' raised: {e}"
 
 
+# One encoder for every webhook payload, instead of json.dumps building a new
+# JSONEncoder per call for non-default options
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+# Idle keep-alive connections per (scheme, netloc), so repeated pipeline runs
+# in one process skip the DNS/TCP/TLS setup for the webhook endpoint
+_webhook_conns: dict[tuple[str, str], http.client.HTTPConnection] = {}
+_webhook_lock = threading.Lock()
+
+# Statuses http.client does not follow; these are re-sent through urlopen
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+def _close_webhook_conns() -> None:
+    with _webhook_lock:
+        conns = list(_webhook_conns.values())
+        _webhook_conns.clear()
+    for conn in conns:
+        conn.close()
+
+
+atexit.register(_close_webhook_conns)
+
+
+def _post_webhook(parts: urllib.parse.SplitResult, body: bytes) -> int:
+    """POST *body* over a pooled keep-alive connection; returns the HTTP status."""
+    key = (parts.scheme, parts.netloc)
+    with _webhook_lock:
+        conn = _webhook_conns.pop(key, None)
+    reused = conn is not None
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    while True:
+        if conn is None:
+            if parts.scheme == "https":
+                conn = http.client.HTTPSConnection(parts.hostname or "", parts.port, timeout=10)
+            else:
+                conn = http.client.HTTPConnection(parts.hostname or "", parts.port, timeout=10)
+        try:
+            conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+        except (BrokenPipeError, ConnectionResetError):  # incl. RemoteDisconnected
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped the idle keep-alive connection before answering;
+            # retry once fresh. Anything else (a read timeout in particular) may
+            # mean the POST was already received, so it is not re-sent.
+            conn, reused = None, False
+            continue
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
+        try:
+            response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
+        break
+
+    with _webhook_lock:
+        stale = _webhook_conns.pop(key, None)
+        _webhook_conns[key] = conn
+    if stale is not None:
+        stale.close()
+    return response.status
+
+
 def _send_webhook(url: str, payload: dict[str, object]) -> None:
     """Send webhook notification. Best-effort, never raises."""
     try:
-        body = json.dumps(payload, ensure_ascii=False).encode()
+        body = _encode_json(payload).encode()
+        parts = urllib.parse.urlsplit(url)
+        direct = parts.scheme in ("http", "https") and parts.scheme not in (
+            urllib.request.getproxies()
+        )
+        if direct and _post_webhook(parts, body) not in _REDIRECT_STATUSES:
+            return
+        # Proxied or unusual URLs, and redirects, go through urllib's full
+        # opener machinery, which follows them
         req = urllib.request.Request(
             url,
             data=body,
@@ -115,11 +248,10 @@ def _run_implementation_phase(
     if iteration == 1:
         prompt_text = prompt_file.read_text()
     else:
-        feedback = (
-            feedback_file.read_text()
-            if feedback_file.is_file()
-            else "No specific feedback available"
-        )
+        try:
+            feedback = feedback_file.read_text()
+        except FileNotFoundError:
+            feedback = "No specific feedback available"
         prompt_text = f"""\
 Read {prompt_file} for the full requirements.
 
@@ -132,11 +264,41 @@ Fix the issues described above. Do NOT start from scratch.
 Read the existing code first, then make targeted fixes only.
 After fixing, verify your changes match the requirements."""
 
+    if _accepts_stdout_sink(runner):
+        # claude writes straight into the log; its output is never held in memory.
+        # Flush first so buffered log lines stay ahead of claude's output.
+        logger.flush()
+        fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            runner.run(
+                prompt_text,
+                timeout=timeout,
+                max_retries=max_retries,
+                logger=logger,
+                stdout_sink=fd,
+            )
+        finally:
+            os.close(fd)
+        return
+
     output = runner.run(prompt_text, timeout=timeout, max_retries=max_retries, logger=logger)
+    logger.flush()
     with log_path.open("a") as f:
         f.write(output)
 
 
+def _accepts_stdout_sink(runner: ClaudeRunner) -> TypeGuard[_SinkClaudeRunner]:
+    """True if *runner*.run() takes the optional ``stdout_sink`` keyword.
+
+    Checked on the signature rather than the class, so a CliClaudeRunner
+    subclass that overrides run() without it keeps the return-a-string path.
+    """
+    try:
+        return "stdout_sink" in inspect.signature(runner.run).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 def _run_quality_gates(
     *,
     gates: list[tuple[str, str]],
@@ -144,6 +306,7 @@ def _run_quality_gates(
     use_parallel: bool,
     timeout: int,
     logger: Logger,
+    executor: ThreadPoolExecutor | None = None,
 ) -> tuple[bool, str, list[GateResult]]:
     """Phase 2: Run all quality gates. Returns (all_passed, failure_output, results)."""
     results: list[GateResult] = []
@@ -153,9 +316,14 @@ def _run_quality_gates(
         logger.info("[Phase 2] No quality gates configured — skipping")
         return True, "", results
 
-    if use_parallel:
+    # A single gate gains nothing from the pool; run it inline
+    if use_parallel and total_gates > 1:
         return _run_gates_parallel(
-            gates=gates, callable_gates=callable_gates, timeout=timeout, logger=logger,
+            gates=gates,
+            callable_gates=callable_gates,
+            timeout=timeout,
+            logger=logger,
+            executor=executor,
         )
 
     return _run_gates_sequential(
@@ -169,34 +337,58 @@ def _run_gates_parallel(
     callable_gates: list[tuple[str, Callable[[], tuple[bool, str]]]],
     timeout: int,
     logger: Logger,
+    executor: ThreadPoolExecutor | None = None,
 ) -> tuple[bool, str, list[GateResult]]:
+    """Run gates concurrently, on *executor* if given (it is not shut down)."""
     total = len(gates) + len(callable_gates)
     logger.info(f"[Phase 2] Running {total} gates in parallel")
-    results: list[GateResult] = []
-    failures: list[str] = []
+    # Slots in declaration order (command gates, then callables), so results
+    # and feedback are deterministic whatever order the gates finish in
+    results: list[GateResult | None] = [None] * total
+    failures: list[str | None] = [None] * total
 
-    with ThreadPoolExecutor(max_workers=max(total, 1)) as executor:
-        future_map: dict[object, str] = {}
-        for name, cmd in gates:
-            future_map[executor.submit(_run_gate_command, cmd, timeout)] = name
-        for cname, cfunc in callable_gates:
-            future_map[executor.submit(_run_callable_gate, cname, cfunc)] = f"callable:{cname}"
+    def _record(index: int, name: str, passed: bool, output: str) -> None:
+        status = GateStatus.PASS if passed else GateStatus.FAIL
+        results[index] = GateResult(name=name, status=status, output=output[:_GATE_OUTPUT_LIMIT])
+        if passed:
+            logger.info(f"[Phase 2] {name}: PASS")
+        else:
+            logger.info(f"[Phase 2] {name}: FAIL")
+            failures[index] = f"{name} FAILED:\n{output}"
+
+    # Gates marked with @sequential_gate run alone, after the concurrent batch
+    indexed = list(enumerate(callable_gates, start=len(gates)))
+    concurrent = [(i, n, f) for i, (n, f) in indexed if not is_sequential_gate(f)]
+    sequential = [(i, n, f) for i, (n, f) in indexed if is_sequential_gate(f)]
+
+    pooled = len(gates) + len(concurrent)
+    if pooled:
+        # Gate threads mostly wait on subprocesses, so one thread per gate
+        # rather than per CPU
+        pool = (
+            ThreadPoolExecutor(max_workers=pooled)
+            if executor is None
+            else nullcontext(executor)
+        )
+        with pool as ex:
+            future_map: dict[object, tuple[int, str]] = {}
+            for i, (name, cmd) in enumerate(gates):
+                future_map[ex.submit(_run_gate_command, cmd, timeout)] = (i, name)
+            for i, cname, cfunc in concurrent:
+                future = ex.submit(_run_callable_gate, cname, cfunc)
+                future_map[future] = (i, f"callable:{cname}")
 
-        for future in as_completed(future_map):
-            name = future_map[future]
-            passed, output = future.result()
-            status = GateStatus.PASS if passed else GateStatus.FAIL
-            results.append(GateResult(name=name, status=status, output=output[:_GATE_OUTPUT_LIMIT]))
+            for future in as_completed(future_map):
+                _record(*future_map[future], *future.result())
 
-            if passed:
-                logger.info(f"[Phase 2] {name}: PASS")
-            else:
-                logger.info(f"[Phase 2] {name}: FAIL")
-                failures.append(f"{name} FAILED:\n{output}")
+    for i, cname, cfunc in sequential:
+        _record(i, f"callable:{cname}", *_run_callable_gate(cname, cfunc))
 
-    if failures:
-        return False, "\n\n".join(failures), results
-    return True, "", results
+    done = [r for r in results if r is not None]
+    failed = [f for f in failures if f is not None]
+    if failed:
+        return False, "\n\n".join(failed), done
+    return True, "", done
 
 
 def _run_gates_sequential(
@@ -245,6 +437,36 @@ def _run_gates_sequential(
     return gate_pass, gate_output, results
 
 
+class _SignalGuard:
+    """Turn SIGINT/SIGTERM into a graceful-stop request for the duration of a run.
+
+    Handlers can only be installed from the main thread; elsewhere the guard is
+    inert, so pipelines can also be driven from worker threads.
+    """
+
+    def __init__(self, logger: Logger) -> None:
+        self.shutdown_requested = False
+        self._logger = logger
+        self._previous: dict[int, Callable[..., object] | int | None] = {}
+
+    def _handle(self, signum: int, _frame: object) -> None:
+        sig_name = signal.Signals(signum).name
+        self._logger.warn(f"Received {sig_name}, will exit after current phase...")
+        self.shutdown_requested = True
+
+    def __enter__(self) -> _SignalGuard:
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                self._previous[signum] = signal.getsignal(signum)
+                signal.signal(signum, self._handle)
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        for signum, handler in self._previous.items():
+            signal.signal(signum, handler)
+        self._previous.clear()
+
+
 def run_pipeline(
     prompt_file: Path,
     requirements_file: Path,
@@ -275,14 +497,63 @@ def run_pipeline(
     out = output_dir or Path(os.environ.get("OUTPUT_DIR", ".agentic-dev-pipeline"))
     out.mkdir(parents=True, exist_ok=True)
 
+    owns_logger = logger is None
     if logger is None:
         logger = Logger(log_file=out / "loop-execution.log")
 
+    try:
+        with _SignalGuard(logger) as guard:
+            return _run_pipeline(
+                prompt_file=prompt_file,
+                requirements_file=requirements_file,
+                out=out,
+                max_iterations=max_iterations,
+                claude_timeout=claude_timeout,
+                max_retries=max_retries,
+                webhook_url=webhook_url,
+                parallel_gates=parallel_gates,
+                plugin_dir=plugin_dir,
+                config=config,
+                logger=logger,
+                guard=guard,
+                custom_gates=custom_gates,
+                runner=runner,
+                claude_model=claude_model,
+                claude_model_verify=claude_model_verify,
+            )
+    finally:
+        if owns_logger:
+            logger.close()
+        else:
+            logger.flush()
+
+
+def _run_pipeline(
+    *,
+    prompt_file: Path,
+    requirements_file: Path,
+    out: Path,
+    max_iterations: int,
+    claude_timeout: int,
+    max_retries: int,
+    webhook_url: str,
+    parallel_gates: bool | None,
+    plugin_dir: str | None,
+    config: ProjectConfig | None,
+    logger: Logger,
+    guard: _SignalGuard,
+    custom_gates: list[tuple[str, Callable[[], tuple[bool, str]]]] | None,
+    runner: ClaudeRunner | None,
+    claude_model: str,
+    claude_model_verify: str,
+) -> bool:
     cfg = config or detect_all()
-    _runner = runner or CliClaudeRunner(model=claude_model)
-    _verify_runner = CliClaudeRunner(model=claude_model_verify)
     feedback_file = out / "feedback.txt"
-    metrics = PipelineMetrics(started_at=time.strftime("%Y-%m-%dT%H:%M:%S%z"))
+    log_path = out / "loop-execution.log"
+    # Wall-clock time is only read for the two reported timestamps; durations
+    # use the monotonic clock, which is immune to clock adjustments
+    started = time.localtime()
+    metrics = PipelineMetrics(started_at=time.strftime(_ISO_FORMAT, started))
     use_parallel = parallel_gates if parallel_gates is not None else (
         os.environ.get("PARALLEL_GATES", "").lower() in ("true", "1", "yes")
     )
@@ -291,20 +562,7 @@ def run_pipeline(
     # Unset CLAUDECODE to allow nested calls
     os.environ.pop("CLAUDECODE", None)
 
-    shutdown_requested = False
-
-    def _signal_handler(signum: int, _frame: object) -> None:
-        nonlocal shutdown_requested
-        sig_name = signal.Signals(signum).name
-        logger.warn(f"Received {sig_name}, will exit after current phase...")
-        shutdown_requested = True
-
-    original_sigint = signal.getsignal(signal.SIGINT)
-    original_sigterm = signal.getsignal(signal.SIGTERM)
-    signal.signal(signal.SIGINT, _signal_handler)
-    signal.signal(signal.SIGTERM, _signal_handler)
-
-    start_time = time.time()
+    start_time = time.monotonic()
 
     logger.info("=== Agentic Dev Pipeline ===")
     logger.info(cfg.print_config())
@@ -312,22 +570,48 @@ def run_pipeline(
     logger.info(f"Prompt: {prompt_file}")
     logger.info(f"Requirements: {requirements_file}")
     logger.info(f"Output dir: {out}")
-    logger.info(f"Started: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"Started: {time.strftime('%Y-%m-%d %H:%M:%S', started)}")
     logger.info("")
 
-    if not shutil.which("claude"):
+    claude = shutil.which("claude")
+    if not claude:
         logger.error("'claude' CLI not found in PATH. Install Claude Code first.")
         return False
 
+    # Both runners reuse the path resolved above instead of searching PATH again
+    _runner = runner or CliClaudeRunner(model=claude_model, executable=claude)
+    _verify_runner = CliClaudeRunner(model=claude_model_verify, executable=claude)
+
     converged = False
 
+    # The gate set is fixed for the run; build it once, not per iteration
+    gates: list[tuple[str, str]] = []
+    if cfg.lint_cmd:
+        gates.append(("lint", cfg.lint_cmd))
+    if cfg.test_cmd:
+        gates.append(("test", cfg.test_cmd))
+    if cfg.security_cmd:
+        gates.append(("security", cfg.security_cmd))
+    for plugin_name, plugin_cmd in plugins:
+        gates.append((f"plugin:{plugin_name}", plugin_cmd))
+    callable_gates = custom_gates or []
+
+    # One pool for every iteration's gates, a thread per gate; threads are
+    # started on first use
+    total_gates = len(gates) + len(callable_gates)
+    gate_executor = (
+        ThreadPoolExecutor(max_workers=total_gates, thread_name_prefix="gate")
+        if use_parallel and total_gates > 1
+        else None
+    )
+
     try:
         for iteration in range(1, max_iterations + 1):
-            if shutdown_requested:
+            if guard.shutdown_requested:
                 logger.warn("Shutdown requested, stopping pipeline")
                 break
 
-            iter_start = time.time()
+            iter_start = time.monotonic()
             iter_metrics = IterationMetrics(iteration=iteration)
 
             logger.info(f"--- Iteration {iteration} / {max_iterations} ---")
@@ -340,7 +624,7 @@ def run_pipeline(
                 prompt_file=prompt_file,
                 feedback_file=feedback_file,
                 runner=_runner,
-                log_path=out / "loop-execution.log",
+                log_path=log_path,
                 timeout=claude_timeout,
                 max_retries=max_retries,
                 logger=logger,
@@ -349,37 +633,26 @@ def run_pipeline(
             iter_metrics.phase1_done = True
             logger.phase_end("phase1_implement", "completed", iteration=iteration)
 
-            if shutdown_requested:
+            if guard.shutdown_requested:
                 break
 
             # Phase 2: Quality Gates
             logger.phase_start("phase2_quality_gates", iteration=iteration)
 
-            gates: list[tuple[str, str]] = []
-            if cfg.lint_cmd:
-                gates.append(("lint", cfg.lint_cmd))
-            if cfg.test_cmd:
-                gates.append(("test", cfg.test_cmd))
-            if cfg.security_cmd:
-                gates.append(("security", cfg.security_cmd))
-            for plugin_name, plugin_cmd in plugins:
-                gates.append((f"plugin:{plugin_name}", plugin_cmd))
-
-            callable_gates = custom_gates or []
-
             gate_pass, gate_output, gate_results = _run_quality_gates(
                 gates=gates,
                 callable_gates=callable_gates,
                 use_parallel=use_parallel,
                 timeout=claude_timeout,
                 logger=logger,
+                executor=gate_executor,
             )
             iter_metrics.gate_results = gate_results
 
             if not gate_pass:
                 feedback_file.write_text(gate_output)
                 iter_metrics.outcome = IterationOutcome.GATE_FAIL
-                iter_metrics.duration_s = round(time.time() - iter_start, 2)
+                iter_metrics.duration_s = round(time.monotonic() - iter_start, 2)
                 metrics.iterations.append(iter_metrics)
                 logger.phase_end("phase2_quality_gates", "fail", iteration=iteration)
                 logger.info(f"[Phase 2] FAILED — looping back (took {iter_metrics.duration_s}s)")
@@ -388,13 +661,13 @@ def run_pipeline(
 
             logger.phase_end("phase2_quality_gates", "pass", iteration=iteration)
 
-            if shutdown_requested:
+            if guard.shutdown_requested:
                 break
 
             # Phase 3: Triangular Verification
             logger.phase_start("phase3_triangular_verify", iteration=iteration)
 
-            passed = run_triangular_verification(
+            passed, report = _triangular_verification(
                 requirements_file=requirements_file,
                 output_dir=out,
                 config=cfg,
@@ -409,15 +682,12 @@ def run_pipeline(
                 logger.phase_end("phase3_triangular_verify", "pass", iteration=iteration)
             else:
                 iter_metrics.verification_status = GateStatus.FAIL
-                discrepancy_file = out / "discrepancy-report.md"
-                if discrepancy_file.is_file():
-                    feedback_file.write_text(discrepancy_file.read_text())
-                else:
-                    feedback_file.write_text(
-                        "Triangular verification failed but no discrepancy report found."
-                    )
+                # The report is also in discrepancy-report.md; reuse it from memory
+                feedback_file.write_text(
+                    report or "Triangular verification failed but no discrepancy report found."
+                )
                 iter_metrics.outcome = IterationOutcome.VERIFY_FAIL
-                iter_metrics.duration_s = round(time.time() - iter_start, 2)
+                iter_metrics.duration_s = round(time.monotonic() - iter_start, 2)
                 metrics.iterations.append(iter_metrics)
                 logger.phase_end("phase3_triangular_verify", "fail", iteration=iteration)
                 logger.info(f"[Phase 3] FAILED — looping back (took {iter_metrics.duration_s}s)")
@@ -426,10 +696,10 @@ def run_pipeline(
 
             # Phase 4: Complete
             iter_metrics.outcome = IterationOutcome.PASS
-            iter_metrics.duration_s = round(time.time() - iter_start, 2)
+            iter_metrics.duration_s = round(time.monotonic() - iter_start, 2)
             metrics.iterations.append(iter_metrics)
 
-            total_time = round(time.time() - start_time, 2)
+            total_time = round(time.monotonic() - start_time, 2)
 
             logger.info("")
             logger.info("=== LOOP_COMPLETE ===")
@@ -441,23 +711,32 @@ def run_pipeline(
             break
 
     finally:
-        signal.signal(signal.SIGINT, original_sigint)
-        signal.signal(signal.SIGTERM, original_sigterm)
+        if gate_executor is not None:
+            gate_executor.shutdown()
 
-        total_time = round(time.time() - start_time, 2)
-        metrics.ended_at = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+        total_time = round(time.monotonic() - start_time, 2)
+        metrics.ended_at = time.strftime(_ISO_FORMAT)
         metrics.total_duration_s = total_time
         metrics.total_iterations = len(metrics.iterations)
         metrics.converged = converged
-        metrics.save(out / "metrics.json")
 
+        # Overlap the webhook round-trip with the metrics write
+        webhook: threading.Thread | None = None
         if webhook_url:
-            _send_webhook(webhook_url, {
-                "pipeline": "agentic-dev-pipeline",
-                "converged": converged,
-                "iterations": metrics.total_iterations,
-                "duration_s": total_time,
-            })
+            webhook = threading.Thread(
+                target=_send_webhook,
+                args=(webhook_url, {
+                    "pipeline": "agentic-dev-pipeline",
+                    "converged": converged,
+                    "iterations": metrics.total_iterations,
+                    "duration_s": total_time,
+                }),
+                daemon=True,
+            )
+            webhook.start()
+        metrics.save(out / "metrics.json")
+        if webhook is not None:
+            webhook.join()
 
     if not converged:
         logger.info("")
@@ -465,6 +744,6 @@ def run_pipeline(
         logger.info(f"Completed {max_iterations} iterations without full convergence.")
         logger.info(f"Total time: {total_time}s")
         logger.info(f"Review remaining issues in: {feedback_file}")
-        logger.info(f"Review full log in: {out / 'loop-execution.log'}")
+        logger.info(f"Review full log in: {log_path}")
 
     return converged
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 import subprocess
 import time
 from typing import Protocol
@@ -8,6 +9,13 @@ from agentic_dev_pipeline.log import Logger
 
 
 class ClaudeRunner(Protocol):
+    """Runs one claude prompt and returns its output.
+
+    Implementations may also accept an optional ``stdout_sink`` keyword (an
+    open file descriptor, see CliClaudeRunner.run); the pipeline passes one
+    only to runners whose run() signature declares it.
+    """
+
     def run(
         self,
         prompt: str,
@@ -18,11 +26,32 @@ class ClaudeRunner(Protocol):
     ) -> str: ...
 
 
+class _SinkClaudeRunner(Protocol):
+    """A ClaudeRunner whose run() also takes ``stdout_sink``, like CliClaudeRunner."""
+
+    def run(
+        self,
+        prompt: str,
+        *,
+        timeout: int = 300,
+        max_retries: int = 2,
+        logger: Logger | None = None,
+        stdout_sink: int | None = None,
+    ) -> str: ...
+
+
 class CliClaudeRunner:
     """Run claude CLI via subprocess with retry and backoff."""
 
-    def __init__(self, *, model: str = "") -> None:
+    def __init__(self, *, model: str = "", executable: str | None = None) -> None:
         self._model = model
+        self._executable = executable
+
+    def _claude(self) -> str:
+        """Absolute path of the claude CLI, looked up on first use."""
+        if self._executable is None:
+            self._executable = shutil.which("claude") or "claude"
+        return self._executable
 
     def run(
         self,
@@ -31,21 +60,34 @@ class CliClaudeRunner:
         timeout: int = 300,
         max_retries: int = 2,
         logger: Logger | None = None,
+        stdout_sink: int | None = None,
     ) -> str:
+        """Run claude and return its stdout.
+
+        With *stdout_sink* (an open file descriptor) claude writes its output
+        straight to that fd instead, and an empty string is returned. The fd
+        then also receives the output of failed or timed-out attempts.
+        """
         for attempt in range(1, max_retries + 1):
             try:
-                cmd = ["claude", "--print"]
+                cmd = [self._claude(), "--print"]
                 if self._model:
                     cmd.extend(["--model", self._model])
                 cmd.extend(["-p", prompt])
+                # An absolute executable, no cwd/preexec_fn and close_fds=False
+                # let subprocess use posix_spawn (vfork semantics) instead of
+                # fork+exec. Python-opened fds are non-inheritable, so nothing
+                # leaks into claude.
                 result = subprocess.run(
                     cmd,
-                    capture_output=True,
+                    stdout=subprocess.PIPE if stdout_sink is None else stdout_sink,
+                    stderr=subprocess.PIPE,
                     text=True,
                     timeout=timeout,
+                    close_fds=False,
                 )
                 if result.returncode == 0:
-                    return result.stdout
+                    return result.stdout or ""
                 if logger:
                     logger.warn(
                         f"claude exited with code {result.returncode} (attempt {attempt})"
@@ -9,6 +9,11 @@ from agentic_dev_pipeline.domain import TRIANGULAR_PASS_MARKER
 from agentic_dev_pipeline.log import Logger
 from agentic_dev_pipeline.runner import ClaudeRunner, CliClaudeRunner
 
+# Blind reviews up to this many UTF-8 bytes are passed to Agent C inline. The
+# prompt is a single argv string, which Linux caps at 128 KiB (MAX_ARG_STRLEN);
+# the other half is headroom for the rest of Agent C's prompt.
+_INLINE_REVIEW_LIMIT = 64 * 1024
+
 
 def run_triangular_verification(
     requirements_file: Path,
@@ -33,6 +38,29 @@ def run_triangular_verification(
     Returns:
         True if verification passed, False otherwise.
     """
+    passed, _report = _triangular_verification(
+        requirements_file=requirements_file,
+        output_dir=output_dir,
+        config=config,
+        timeout=timeout,
+        max_retries=max_retries,
+        logger=logger,
+        runner=runner,
+    )
+    return passed
+
+
+def _triangular_verification(
+    *,
+    requirements_file: Path,
+    output_dir: Path,
+    config: ProjectConfig | None,
+    timeout: int,
+    max_retries: int,
+    logger: Logger | None,
+    runner: ClaudeRunner | None,
+) -> tuple[bool, str]:
+    """run_triangular_verification, also returning the discrepancy report text."""
     if logger is None:
         logger = Logger()
 
@@ -80,18 +108,30 @@ For each file:
 Output your analysis as structured markdown."""
 
     output_b = _runner.run(agent_b_prompt, timeout=timeout, max_retries=max_retries, logger=logger)
-    blind_review_file.write_text(output_b)
-    logger.info(f"Blind review saved to {blind_review_file}")
 
     # --- Agent C: Discrepancy Report ---
     logger.info("Phase C: Discrepancy report (requirements vs blind review)")
 
+    blind_review_file.write_text(output_b)
+    logger.info(f"Blind review saved to {blind_review_file}")
+
+    # Hand the blind review to Agent C inline so it need not read it back from
+    # disk. Very large reviews are referenced by path instead, to stay under the
+    # per-argument size limit.
+    if len(output_b.encode()) <= _INLINE_REVIEW_LIMIT:
+        review_source = (
+            f"the blind code analysis by another agent, below (also saved to "
+            f"{blind_review_file})\n\n<blind-review>\n{output_b}\n</blind-review>"
+        )
+    else:
+        review_source = f"{blind_review_file} (blind code analysis by another agent)"
+
     agent_c_prompt = f"""\
 You are Agent C in a triangular verification process.
 
 Read these two documents carefully:
 1. {requirements_file} (original requirements — the source of truth)
-2. {blind_review_file} (blind code analysis by another agent)
+2. {review_source}
 
 Do NOT read any code files directly.
 
@@ -119,15 +159,14 @@ Otherwise, list each issue that must be fixed."""
     discrepancy_file.write_text(output_c)
     logger.info(f"Discrepancy report saved to {discrepancy_file}")
 
-    report_text = discrepancy_file.read_text()
-    passed = TRIANGULAR_PASS_MARKER in report_text
+    passed = TRIANGULAR_PASS_MARKER in output_c
 
     if passed:
         logger.info("RESULT: PASS")
     else:
         logger.info(f"RESULT: FAIL — issues found in {discrepancy_file}")
 
-    return passed
+    return passed, output_c
 
 
 def main() -> None:
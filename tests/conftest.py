@@ -1,47 +1,95 @@
 """Shared pytest fixtures."""
 
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
+from agentic_dev_pipeline.detect import _resolve_cmd_cached
+
+
+def _write_files(root: Path, files: dict[str, str]) -> Path:
+    """Write *files* (relative path -> content) under *root*; returns *root*.
+
+    Each parent directory is created once, however many files it holds.
+    """
+    made: set[str] = set()
+    for rel, content in files.items():
+        parent = os.path.dirname(rel)
+        if parent and parent not in made:
+            os.makedirs(root / parent, exist_ok=True)
+            made.add(parent)
+        with open(root / rel, "w") as f:
+            f.write(content)
+    return root
+
+
+def _write_exec(path: Path, content: bytes) -> Path:
+    """Create *path* executable (mode 0o755) holding *content*; returns *path*.
+
+    One os.open creates the file with its mode, so no chmod follows the write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+    return path
+
+
+@pytest.fixture(scope="session")
+def write_exec():
+    """The _write_exec helper, for test modules (conftest is not importable)."""
+    return _write_exec
+
+
+@pytest.fixture(autouse=True)
+def _clear_resolve_cache():
+    """Start every test with no resolved commands.
+
+    The cache is keyed on PATH and sys.prefix, but a stub executable one test
+    created may be gone by the next.
+    """
+    _resolve_cmd_cached.cache_clear()
+    yield
+    _resolve_cmd_cached.cache_clear()
+
 
 @pytest.fixture
 def python_project(tmp_path: Path) -> Path:
     """Create a minimal Python project in tmp_path."""
-    (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\n')
-    (tmp_path / "src").mkdir()
-    (tmp_path / "src" / "main.py").write_text("print('hello')\n")
-    return tmp_path
+    return _write_files(tmp_path, {
+        "pyproject.toml": '[project]\nname = "test"\n',
+        "src/main.py": "print('hello')\n",
+    })
 
 
 @pytest.fixture
 def node_project(tmp_path: Path) -> Path:
     """Create a minimal Node project in tmp_path."""
-    (tmp_path / "package.json").write_text(
-        '{"name": "test", "scripts": {"lint": "eslint .", "test": "jest"}}\n'
-    )
-    (tmp_path / "src").mkdir()
-    (tmp_path / "src" / "index.js").write_text("module.exports = {};\n")
-    return tmp_path
+    return _write_files(tmp_path, {
+        "package.json": '{"name": "test", "scripts": {"lint": "eslint .", "test": "jest"}}\n',
+        "src/index.js": "module.exports = {};\n",
+    })
 
 
 @pytest.fixture
 def rust_project(tmp_path: Path) -> Path:
     """Create a minimal Rust project in tmp_path."""
-    (tmp_path / "Cargo.toml").write_text('[package]\nname = "test"\nversion = "0.1.0"\n')
-    (tmp_path / "src").mkdir()
-    (tmp_path / "src" / "main.rs").write_text("fn main() {}\n")
-    return tmp_path
+    return _write_files(tmp_path, {
+        "Cargo.toml": '[package]\nname = "test"\nversion = "0.1.0"\n',
+        "src/main.rs": "fn main() {}\n",
+    })
 
 
 @pytest.fixture
 def go_project(tmp_path: Path) -> Path:
     """Create a minimal Go project in tmp_path."""
-    (tmp_path / "go.mod").write_text("module test\n\ngo 1.21\n")
-    (tmp_path / "pkg").mkdir()
-    (tmp_path / "pkg" / "main.go").write_text("package main\n")
-    return tmp_path
+    return _write_files(tmp_path, {
+        "go.mod": "module test\n\ngo 1.21\n",
+        "pkg/main.go": "package main\n",
+    })
 
 
 @pytest.fixture
@@ -51,15 +99,47 @@ def empty_project(tmp_path: Path) -> Path:
     return tmp_path
 
 
+_CLEAN_ENV_VARS = frozenset({
+    "PROJECT_TYPE", "SRC_DIRS", "LINT_CMD", "TEST_CMD", "SECURITY_CMD",
+    "INSTRUCTION_FILES", "DESIGN_DOCS", "CHANGED_FILES", "BASE_BRANCH",
+    "DEBUG", "LOG_FORMAT", "WEBHOOK_URL", "CLAUDE_TIMEOUT", "MAX_RETRIES",
+})
+
+
 @pytest.fixture
 def clean_env(monkeypatch: pytest.MonkeyPatch):
-    """Remove all detection-related env vars to ensure clean state."""
-    for var in (
-        "PROJECT_TYPE", "SRC_DIRS", "LINT_CMD", "TEST_CMD", "SECURITY_CMD",
-        "INSTRUCTION_FILES", "DESIGN_DOCS", "CHANGED_FILES", "BASE_BRANCH",
-        "DEBUG", "LOG_FORMAT", "WEBHOOK_URL", "CLAUDE_TIMEOUT", "MAX_RETRIES",
-    ):
-        monkeypatch.delenv(var, raising=False)
+    """Remove all detection-related env vars to ensure clean state.
+
+    Only the variables actually set are touched, usually none. os.environ
+    itself is kept (not swapped for a dict) so subprocesses see the same
+    environment as the code under test.
+    """
+    for var in _CLEAN_ENV_VARS.intersection(os.environ):
+        monkeypatch.delenv(var)
+
+
+@pytest.fixture(scope="session")
+def fake_venv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A venv whose bin/ holds executable stubs for the tools detection probes.
+
+    Each stub is a symlink to the running interpreter: one syscall, and always
+    executable. Built once per session; tests must treat it as read-only.
+    """
+    venv = tmp_path_factory.mktemp("fake-venv")
+    bin_dir = venv / "bin"
+    bin_dir.mkdir()
+    for tool in ("bandit", "pytest", "ruff"):
+        os.symlink(sys.executable, bin_dir / tool)
+    return venv
+
+
+@pytest.fixture
+def in_fake_venv(fake_venv: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run inside fake_venv with an empty PATH; returns its bin/ directory."""
+    monkeypatch.setenv("PATH", "")
+    monkeypatch.setattr(sys, "prefix", str(fake_venv))
+    monkeypatch.setattr(sys, "base_prefix", "/usr")
+    return fake_venv / "bin"
 
 
 @pytest.fixture
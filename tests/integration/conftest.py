@@ -0,0 +1,18 @@
+"""Fixtures shared by the integration tests."""
+
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def tmp_path(tmp_path: Path) -> Iterator[Path]:
+    """tmp_path, removed once the test finishes.
+
+    A pipeline run leaves logs, metrics and feedback files behind; pytest would
+    keep the last three sessions of them on disk.
+    """
+    yield tmp_path
+    shutil.rmtree(tmp_path, ignore_errors=True)
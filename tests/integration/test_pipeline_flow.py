@@ -1,9 +1,9 @@
-"""Integration tests for the pipeline flow using a mock claude CLI."""
+"""Integration tests for the pipeline flow using an in-process claude stub."""
 
 import json
 import os
-import stat
-import textwrap
+import shutil
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -11,50 +11,94 @@ import pytest
 from agentic_dev_pipeline.detect import ProjectConfig
 from agentic_dev_pipeline.domain import PipelineMetrics
 from agentic_dev_pipeline.pipeline import run_pipeline
+from agentic_dev_pipeline.runner import CliClaudeRunner
+
+# Mock claude CLI for the subprocess smoke test: passes Agent C, reviews otherwise.
+# The prompt match is a shell builtin, so a call forks no echo/grep, and /bin/sh
+# (dash on Debian) starts faster than bash.
+_MOCK_CLAUDE_SH = b"""#!/bin/sh
+case "$*" in
+    *"Agent C"*)
+        echo "## Verdict"
+        echo "TRIANGULAR_PASS"
+        ;;
+    *)
+        echo "## Blind Review"
+        echo "Code looks correct."
+        ;;
+esac
+exit 0
+"""
+
+
+def _stub_claude(monkeypatch: pytest.MonkeyPatch, respond: Callable[[str], str]) -> list[str]:
+    """Answer claude calls in-process: no mock script, no fork+exec per call.
+
+    Patches CliClaudeRunner.run and makes the pipeline's PATH check find
+    claude. Returns the list of prompts received, in call order.
+    """
+    prompts: list[str] = []
+    real_which = shutil.which
+
+    def which(cmd: str, *args: object, **kwargs: object) -> str | None:
+        return "/stub/bin/claude" if cmd == "claude" else real_which(cmd, *args, **kwargs)
+
+    def run(self, prompt, *, timeout=300, max_retries=2, logger=None, stdout_sink=None):
+        prompts.append(prompt)
+        output = respond(prompt)
+        if stdout_sink is not None:
+            os.write(stdout_sink, output.encode())
+            return ""
+        return output
+
+    monkeypatch.setattr(shutil, "which", which)
+    monkeypatch.setattr(CliClaudeRunner, "run", run)
+    return prompts
 
 
 @pytest.fixture
-def mock_claude(tmp_path: Path) -> Path:
-    """Create a mock claude CLI that succeeds and outputs a marker."""
-    bin_dir = tmp_path / "bin"
-    bin_dir.mkdir()
-    mock = bin_dir / "claude"
-    mock.write_text(textwrap.dedent("""\
-        #!/bin/bash
-        echo "Mock claude output: $@"
-        exit 0
-    """))
-    mock.chmod(mock.stat().st_mode | stat.S_IEXEC)
-    return bin_dir
+def mock_claude(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Stub claude that succeeds and echoes a marker plus the prompt."""
+    return _stub_claude(monkeypatch, lambda prompt: f"Mock claude output: {prompt}\n")
 
 
 @pytest.fixture
-def mock_claude_verify_pass(tmp_path: Path) -> Path:
-    """Create a mock claude that outputs TRIANGULAR_PASS for verification."""
-    bin_dir = tmp_path / "bin"
-    bin_dir.mkdir(exist_ok=True)
-    mock = bin_dir / "claude"
-    # The mock checks if the prompt mentions "discrepancy" to output TRIANGULAR_PASS
-    mock.write_text(textwrap.dedent("""\
-        #!/bin/bash
-        if echo "$@" | grep -q "Agent C"; then
-            echo "## Verdict"
-            echo "TRIANGULAR_PASS"
-        else
-            echo "## Blind Review"
-            echo "Code looks correct."
-        fi
-        exit 0
-    """))
-    mock.chmod(mock.stat().st_mode | stat.S_IEXEC)
+def mock_claude_verify_pass(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Stub claude whose Agent C verdict is TRIANGULAR_PASS."""
+
+    def respond(prompt: str) -> str:
+        if "Agent C" in prompt:
+            return "## Verdict\nTRIANGULAR_PASS\n"
+        return "## Blind Review\nCode looks correct.\n"
+
+    return _stub_claude(monkeypatch, respond)
+
+
+@pytest.fixture(scope="session")
+def claude_cli(tmp_path_factory: pytest.TempPathFactory, write_exec) -> Path:
+    """Directory holding a real mock claude executable, written once per session.
+
+    Only the subprocess smoke test puts it on PATH, through its own monkeypatch,
+    so other tests (and other xdist workers) never see it.
+    """
+    bin_dir = tmp_path_factory.mktemp("mockbin")
+    write_exec(bin_dir / "claude", _MOCK_CLAUDE_SH)
     return bin_dir
 
 
+@pytest.fixture(scope="session")
+def pipeline_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Prompt and requirements files, written once per session."""
+    root = tmp_path_factory.mktemp("pipeline-template")
+    (root / "PROMPT.md").write_text("# Feature: Test\nImplement a hello function.\n")
+    (root / "requirements.md").write_text("# Requirements\n1. Function returns 'hello'\n")
+    return root
+
+
 @pytest.fixture
-def pipeline_project(tmp_path: Path) -> Path:
-    """Create a minimal project with prompt and requirements files."""
-    (tmp_path / "PROMPT.md").write_text("# Feature: Test\nImplement a hello function.\n")
-    (tmp_path / "requirements.md").write_text("# Requirements\n1. Function returns 'hello'\n")
+def pipeline_project(tmp_path: Path, pipeline_template: Path) -> Path:
+    """A minimal project with prompt and requirements files, copied from the template."""
+    shutil.copytree(pipeline_template, tmp_path, dirs_exist_ok=True)
     return tmp_path
 
 
@@ -80,7 +124,6 @@ class TestPipelineFlow:
         self, pipeline_project, mock_claude_verify_pass, monkeypatch, clean_env
     ):
         """Pipeline converges when no quality gates and verification passes."""
-        monkeypatch.setenv("PATH", f"{mock_claude_verify_pass}:{os.environ.get('PATH', '')}")
         monkeypatch.chdir(pipeline_project)
 
         config = ProjectConfig(
@@ -104,19 +147,42 @@ class TestPipelineFlow:
         metrics = json.loads((output_dir / "metrics.json").read_text())
         assert metrics["converged"] is True
 
+    def test_pipeline_sends_webhook(
+        self, pipeline_project, mock_claude_verify_pass, monkeypatch, clean_env
+    ):
+        """Webhook is delivered before run_pipeline returns, alongside metrics.json."""
+        monkeypatch.chdir(pipeline_project)
+        sent: list[tuple[str, dict]] = []
+        monkeypatch.setattr(
+            "agentic_dev_pipeline.pipeline._send_webhook",
+            lambda url, payload: sent.append((url, payload)),
+        )
+        output_dir = pipeline_project / ".agentic-dev-pipeline"
+
+        result = run_pipeline(
+            prompt_file=pipeline_project / "PROMPT.md",
+            requirements_file=pipeline_project / "requirements.md",
+            output_dir=output_dir,
+            max_iterations=1,
+            config=ProjectConfig(project_type="python"),
+            webhook_url="https://hooks.example.com/x",
+        )
+
+        assert result is True
+        assert (output_dir / "metrics.json").is_file()
+        assert len(sent) == 1
+        url, payload = sent[0]
+        assert url == "https://hooks.example.com/x"
+        assert payload["converged"] is True
+        assert payload["iterations"] == 1
+
     def test_pipeline_gate_failure_loops(
         self, pipeline_project, mock_claude, monkeypatch, clean_env
     ):
         """Pipeline loops back when quality gate fails."""
-        monkeypatch.setenv("PATH", f"{mock_claude}:{os.environ.get('PATH', '')}")
         monkeypatch.chdir(pipeline_project)
 
-        config = ProjectConfig(
-            project_type="python",
-            lint_cmd="false",  # Always fails
-            test_cmd="",
-            security_cmd="",
-        )
+        config = ProjectConfig(project_type="python")
         output_dir = pipeline_project / ".agentic-dev-pipeline"
 
         result = run_pipeline(
@@ -125,6 +191,7 @@ class TestPipelineFlow:
             output_dir=output_dir,
             max_iterations=2,
             config=config,
+            custom_gates=[("lint", lambda: (False, "lint-fail"))],  # Always fails
         )
 
         assert result is False
@@ -132,11 +199,39 @@ class TestPipelineFlow:
         assert metrics["converged"] is False
         assert metrics["total_iterations"] == 2
 
+    def test_pipeline_config_gates_recorded(
+        self, pipeline_project, mock_claude, monkeypatch, clean_env
+    ):
+        """Configured lint/test/security commands land in the per-iteration metrics."""
+        monkeypatch.chdir(pipeline_project)
+
+        config = ProjectConfig(
+            project_type="python",
+            lint_cmd="true",
+            test_cmd="true",
+            security_cmd="false",
+        )
+        output_dir = pipeline_project / ".agentic-dev-pipeline"
+
+        result = run_pipeline(
+            prompt_file=pipeline_project / "PROMPT.md",
+            requirements_file=pipeline_project / "requirements.md",
+            output_dir=output_dir,
+            max_iterations=1,
+            config=config,
+        )
+
+        assert result is False
+        metrics = json.loads((output_dir / "metrics.json").read_text())
+        iteration = metrics["iterations"][0]
+        assert iteration["lint_result"] == "pass"
+        assert iteration["test_result"] == "pass"
+        assert iteration["security_result"] == "fail"
+
     def test_pipeline_json_logging(
         self, pipeline_project, mock_claude_verify_pass, monkeypatch, clean_env
     ):
         """Pipeline produces JSON log lines when LOG_FORMAT=json."""
-        monkeypatch.setenv("PATH", f"{mock_claude_verify_pass}:{os.environ.get('PATH', '')}")
         monkeypatch.setenv("LOG_FORMAT", "json")
         monkeypatch.chdir(pipeline_project)
 
@@ -153,30 +248,22 @@ class TestPipelineFlow:
 
         log_file = output_dir / "loop-execution.log"
         assert log_file.is_file()
-        # Logger lines should be valid JSON; claude output lines are plain text
-        json_lines = []
-        for line in log_file.read_text().strip().splitlines():
-            line = line.strip()
-            if line and line.startswith("{"):
-                json.loads(line)  # Should not raise
-                json_lines.append(line)
+        # Every line except the stub claude's plain-text output is a Logger
+        # record and must parse as a JSON object (json.loads raises otherwise)
+        claude_output = {b"## Blind Review\n", b"Code looks correct.\n"}
+        with log_file.open("rb") as fp:
+            records = [json.loads(line) for line in fp if line not in claude_output]
+        assert all(isinstance(r, dict) for r in records)
         # Should have logged multiple JSON events
-        assert len(json_lines) > 5
-
+        assert len(records) > 5
 
     def test_pipeline_parallel_gates(
         self, pipeline_project, mock_claude_verify_pass, monkeypatch, clean_env
     ):
         """Pipeline works with parallel gate execution."""
-        monkeypatch.setenv("PATH", f"{mock_claude_verify_pass}:{os.environ.get('PATH', '')}")
         monkeypatch.chdir(pipeline_project)
 
-        config = ProjectConfig(
-            project_type="python",
-            lint_cmd="true",
-            test_cmd="true",
-            security_cmd="true",
-        )
+        config = ProjectConfig(project_type="python")
         output_dir = pipeline_project / ".agentic-dev-pipeline"
 
         result = run_pipeline(
@@ -186,29 +273,26 @@ class TestPipelineFlow:
             max_iterations=2,
             parallel_gates=True,
             config=config,
+            custom_gates=[(name, lambda: (True, "")) for name in ("lint", "test", "security")],
         )
 
         assert result is True
         metrics = json.loads((output_dir / "metrics.json").read_text())
         assert metrics["converged"] is True
-        iter0 = metrics["iterations"][0]
-        assert iter0["lint_result"] == "pass"
-        assert iter0["test_result"] == "pass"
-        assert iter0["security_result"] == "pass"
+        gates = metrics["iterations"][0]["plugin_results"]
+        assert [(g["name"], g["result"]) for g in gates] == [
+            ("callable:lint", "pass"),
+            ("callable:test", "pass"),
+            ("callable:security", "pass"),
+        ]
 
     def test_pipeline_parallel_gates_collect_all_failures(
         self, pipeline_project, mock_claude, monkeypatch, clean_env
     ):
         """Parallel gates collect ALL failures, not just the first."""
-        monkeypatch.setenv("PATH", f"{mock_claude}:{os.environ.get('PATH', '')}")
         monkeypatch.chdir(pipeline_project)
 
-        config = ProjectConfig(
-            project_type="python",
-            lint_cmd="echo lint-fail && false",
-            test_cmd="echo test-fail && false",
-            security_cmd="",
-        )
+        config = ProjectConfig(project_type="python")
         output_dir = pipeline_project / ".agentic-dev-pipeline"
 
         result = run_pipeline(
@@ -218,19 +302,22 @@ class TestPipelineFlow:
             max_iterations=1,
             parallel_gates=True,
             config=config,
+            custom_gates=[
+                ("lint", lambda: (False, "lint-fail")),
+                ("test", lambda: (False, "test-fail")),
+            ],
         )
 
         assert result is False
         # Feedback should contain both failures
         feedback = (output_dir / "feedback.txt").read_text()
-        assert "lint" in feedback.lower()
-        assert "test" in feedback.lower()
+        assert "lint-fail" in feedback
+        assert "test-fail" in feedback
 
     def test_pipeline_with_plugins(
         self, pipeline_project, mock_claude_verify_pass, tmp_path, monkeypatch, clean_env
     ):
         """Pipeline loads and runs custom plugins."""
-        monkeypatch.setenv("PATH", f"{mock_claude_verify_pass}:{os.environ.get('PATH', '')}")
         monkeypatch.chdir(pipeline_project)
 
         # Create a plugin dir with a passing plugin
@@ -254,13 +341,10 @@ class TestPipelineFlow:
 
 
 class TestTriangularVerifyIntegration:
-    def test_verify_pass(
-        self, pipeline_project, mock_claude_verify_pass, monkeypatch, clean_env
-    ):
+    def test_verify_pass(self, pipeline_project, mock_claude_verify_pass, monkeypatch, clean_env):
         """Triangular verification passes with mock claude."""
         from agentic_dev_pipeline.verify import run_triangular_verification
 
-        monkeypatch.setenv("PATH", f"{mock_claude_verify_pass}:{os.environ.get('PATH', '')}")
         monkeypatch.chdir(pipeline_project)
 
         config = ProjectConfig(
@@ -278,3 +362,43 @@ class TestTriangularVerifyIntegration:
         assert result is True
         assert (output_dir / "blind-review.md").is_file()
         assert (output_dir / "discrepancy-report.md").is_file()
+
+    def test_verify_fail_feeds_report_back(self, pipeline_project, monkeypatch, clean_env):
+        """A failed verification's report becomes the next iteration's feedback."""
+        _stub_claude(monkeypatch, lambda prompt: "Requirements Missed: FR-1\n")
+        monkeypatch.chdir(pipeline_project)
+        output_dir = pipeline_project / ".agentic-dev-pipeline"
+
+        result = run_pipeline(
+            prompt_file=pipeline_project / "PROMPT.md",
+            requirements_file=pipeline_project / "requirements.md",
+            output_dir=output_dir,
+            max_iterations=1,
+            config=ProjectConfig(project_type="python"),
+        )
+
+        assert result is False
+        report = (output_dir / "discrepancy-report.md").read_text()
+        assert report == "Requirements Missed: FR-1\n"
+        assert (output_dir / "feedback.txt").read_text() == report
+
+
+@pytest.mark.slow
+class TestClaudeCliSmoke:
+    def test_pipeline_spawns_real_cli(self, pipeline_project, claude_cli, monkeypatch, clean_env):
+        """One end-to-end run through the real subprocess path of CliClaudeRunner."""
+        monkeypatch.setenv("PATH", f"{claude_cli}:{os.environ.get('PATH', '')}")
+        monkeypatch.chdir(pipeline_project)
+        output_dir = pipeline_project / ".agentic-dev-pipeline"
+
+        result = run_pipeline(
+            prompt_file=pipeline_project / "PROMPT.md",
+            requirements_file=pipeline_project / "requirements.md",
+            output_dir=output_dir,
+            max_iterations=1,
+            config=ProjectConfig(project_type="python", lint_cmd="true"),
+        )
+
+        assert result is True
+        assert "## Blind Review" in (output_dir / "loop-execution.log").read_text()
+        assert "TRIANGULAR_PASS" in (output_dir / "discrepancy-report.md").read_text()
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from agentic_dev_pipeline.api import Pipeline
+from agentic_dev_pipeline.detect import detect_all
 
 
 class TestPipelineInit:
@@ -73,6 +74,24 @@ class TestPipelineAddGate:
         p.add_gate("g1", lambda: (True, "")).add_gate("g2", lambda: (True, ""))
         # Gates are stored on Pipeline, not on config
 
+    def test_pattern_gate_scans_src_dirs(self, python_project, clean_env):
+        (python_project / "src" / "main.py").write_text("x = 1  # TODO\n")
+        p = Pipeline(project_root=python_project).add_gate("no-todos", pattern="TODO")
+        [(name, gate)] = p._build_pattern_gates(p.detect())
+        passed, output = gate()
+        assert name == "no-todos"
+        assert passed is False
+        assert "src/main.py:1:" in output
+
+    def test_requires_func_or_pattern(self, tmp_path, clean_env):
+        p = Pipeline(project_root=tmp_path)
+        with pytest.raises(ValueError, match="exactly one"):
+            p.add_gate("g")
+        with pytest.raises(ValueError, match="exactly one"):
+            p.add_gate("g", lambda: (True, ""), pattern="TODO")
+        with pytest.raises(ValueError, match="exactly one"):
+            p.add_gate("g", pattern="TODO", call="print")
+
 
 class TestPipelineDetect:
     def test_detect_returns_project_config(self, python_project, clean_env):
@@ -80,9 +99,35 @@ class TestPipelineDetect:
         cfg = p.detect()
         assert cfg.project_type == "python"
 
+    def test_detect_runs_once(self, python_project, clean_env, monkeypatch):
+        calls: list[object] = []
+        real_detect_all = detect_all
+        monkeypatch.setattr(
+            "agentic_dev_pipeline.api.detect_all",
+            lambda **kw: calls.append(kw) or real_detect_all(**kw),
+        )
+        p = Pipeline(project_root=python_project)
+        assert p.detect() is p.detect()
+        assert p._run_context[2] is p.detect()
+        assert len(calls) == 1
+
 
 class TestPipelineVerify:
     def test_raises_without_requirements(self, tmp_path, clean_env):
         p = Pipeline(project_root=tmp_path)
         with pytest.raises(ValueError, match="requirements_file is required"):
             p.verify()
+
+
+class TestPipelineRunContext:
+    def test_env_read_at_construction(self, tmp_path, clean_env, monkeypatch):
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "out"))
+        p = Pipeline(project_root=tmp_path)
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "other"))
+        output_dir, _logger, _config = p._run_context
+        assert output_dir == tmp_path / "out"
+
+    def test_logger_built_once(self, tmp_path, clean_env, monkeypatch):
+        monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "out"))
+        p = Pipeline(project_root=tmp_path)
+        assert p._run_context[1] is p._run_context[1]
@@ -1,10 +1,19 @@
 """Tests for CLI argument parsing."""
 
 import argparse
+import os
+import subprocess
+import sys
+import threading
 
 import pytest
 
-from agentic_dev_pipeline.cli import _build_parser, _positive_int
+from agentic_dev_pipeline.cli import (
+    _build_parser,
+    _input_files_error,
+    _nonempty_file_error,
+    _positive_int,
+)
 
 
 class TestPositiveInt:
@@ -25,47 +34,113 @@ class TestPositiveInt:
             _positive_int("abc")
 
 
+class TestNonemptyFileError:
+    def test_nonempty_file_passes(self, tmp_path):
+        f = tmp_path / "p.md"
+        f.write_text("x")
+        assert _nonempty_file_error(f, "Prompt") is None
+
+    def test_missing_file(self, tmp_path):
+        error = _nonempty_file_error(tmp_path / "missing.md", "Prompt")
+        assert error is not None
+        assert "Prompt file not found" in error
+
+    def test_directory(self, tmp_path):
+        error = _nonempty_file_error(tmp_path, "Requirements")
+        assert error is not None
+        assert "Requirements file not found" in error
+
+    def test_empty_file(self, tmp_path):
+        f = tmp_path / "r.md"
+        f.write_text("")
+        error = _nonempty_file_error(f, "Requirements")
+        assert error is not None
+        assert "Requirements file is empty" in error
+
+
+class TestInputFilesError:
+    def test_all_present(self, tmp_path):
+        (tmp_path / "p.md").write_text("x")
+        (tmp_path / "r.md").write_text("x")
+        files = [("Prompt", tmp_path / "p.md"), ("Requirements", tmp_path / "r.md")]
+        assert _input_files_error(files) is None
+
+    def test_first_error_in_order(self, tmp_path):
+        (tmp_path / "r.md").write_text("")
+        files = [("Prompt", tmp_path / "p.md"), ("Requirements", tmp_path / "r.md")]
+        assert "Prompt file not found" in _input_files_error(files)
+
+    def test_hung_check_times_out(self, tmp_path, monkeypatch):
+        release = threading.Event()
+        monkeypatch.setattr("agentic_dev_pipeline.cli._STAT_TIMEOUT", 0.01)
+        monkeypatch.setattr(
+            "agentic_dev_pipeline.cli._nonempty_file_error",
+            lambda path, label: release.wait(),
+        )
+        try:
+            error = _input_files_error([("Prompt", tmp_path / "p.md")])
+        finally:
+            release.set()
+        assert error == f"ERROR: Timed out checking prompt file: {tmp_path / 'p.md'}"
+
+
+@pytest.fixture(scope="module")
+def parser() -> argparse.ArgumentParser:
+    """The parser main() uses (_build_parser is cached); parse_args() leaves it unchanged."""
+    return _build_parser()
+
+
 class TestBuildParser:
-    def test_version(self, capsys):
-        parser = _build_parser()
+    def test_version(self, parser, capsys):
         with pytest.raises(SystemExit) as exc_info:
             parser.parse_args(["--version"])
         assert exc_info.value.code == 0
         captured = capsys.readouterr()
         assert "agentic-dev-pipeline" in captured.out
 
-    def test_run_subcommand(self):
-        parser = _build_parser()
+    @pytest.mark.slow
+    def test_version_metadata_not_imported_for_other_commands(self):
+        """Building the parser must not resolve __version__ (importlib.metadata)."""
+        code = (
+            "import sys; from agentic_dev_pipeline.cli import _build_parser; "
+            "_build_parser().parse_args(['detect']); "
+            "print('importlib.metadata' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_run_subcommand(self, parser):
         args = parser.parse_args(["run", "--prompt", "p.md", "--requirements", "r.md"])
         assert args.command == "run"
         assert args.prompt == "p.md"
         assert args.requirements == "r.md"
 
-    def test_verify_subcommand(self):
-        parser = _build_parser()
+    def test_verify_subcommand(self, parser):
         args = parser.parse_args(["verify", "--requirements", "r.md"])
         assert args.command == "verify"
         assert args.requirements == "r.md"
 
-    def test_detect_subcommand(self):
-        parser = _build_parser()
+    def test_detect_subcommand(self, parser):
         args = parser.parse_args(["detect"])
         assert args.command == "detect"
 
-    def test_init_subcommand(self):
-        parser = _build_parser()
+    def test_init_subcommand(self, parser):
         args = parser.parse_args(["init"])
         assert args.command == "init"
         assert args.force is False
 
-    def test_init_with_force(self):
-        parser = _build_parser()
+    def test_init_with_force(self, parser):
         args = parser.parse_args(["init", "--force"])
         assert args.command == "init"
         assert args.force is True
 
-    def test_run_with_all_options(self):
-        parser = _build_parser()
+    def test_run_with_all_options(self, parser):
         args = parser.parse_args([
             "run",
             "--prompt", "p.md",
@@ -83,14 +158,12 @@ class TestBuildParser:
         assert args.base_branch == "develop"
         assert args.webhook_url == "https://hooks.example.com/test"
 
-    def test_no_command_shows_help(self, capsys):
-        parser = _build_parser()
+    def test_no_command_shows_help(self, parser, capsys):
         args = parser.parse_args([])
         assert args.command is None
 
-    def test_run_without_flags_defaults_none(self):
+    def test_run_without_flags_defaults_none(self, parser):
         """CLI flags default to None so config resolution can apply."""
-        parser = _build_parser()
         args = parser.parse_args(["run"])
         assert args.prompt is None
         assert args.requirements is None
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from agentic_dev_pipeline.config import PipelineConfig, _coerce, _normalize_toml
 
 
@@ -15,6 +17,10 @@ class TestCoerce:
         assert isinstance(result, Path)
         assert str(result) == "PROMPT.md"
 
+    def test_path_value_not_rewrapped(self):
+        p = Path("PROMPT.md")
+        assert _coerce("prompt_file", p) is p
+
     def test_string_field_passthrough(self):
         assert _coerce("base_branch", "develop") == "develop"
 
@@ -60,6 +66,20 @@ class TestFromPyproject:
         result = PipelineConfig.from_pyproject(tmp_path)
         assert result == {}
 
+    def test_edit_invalidates_cache(self, tmp_path):
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("[tool.agentic-dev-pipeline]\nmax-iterations = 3\n")
+        assert PipelineConfig.from_pyproject(tmp_path)["max_iterations"] == 3
+        pyproject.write_text("[tool.agentic-dev-pipeline]\nmax-iterations = 12\n")
+        assert PipelineConfig.from_pyproject(tmp_path)["max_iterations"] == 12
+
+    def test_unchanged_file_parsed_once(self, tmp_path, monkeypatch):
+        (tmp_path / "pyproject.toml").write_text("[tool.agentic-dev-pipeline]\nmax-retries = 4\n")
+        PipelineConfig.clear_cache()
+        assert PipelineConfig.from_pyproject(tmp_path)["max_retries"] == 4
+        monkeypatch.setattr("agentic_dev_pipeline.config.tomllib.load", None)  # must not be called
+        assert PipelineConfig.from_pyproject(tmp_path)["max_retries"] == 4
+
 
 class TestFromFile:
     def test_reads_standalone_toml(self, tmp_path):
@@ -101,36 +121,38 @@ class TestResolve:
         assert cfg.prompt_file is None
         assert cfg.base_branch == "main"
 
-    def test_explicit_overrides_all(self, tmp_path, clean_env, monkeypatch):
-        (tmp_path / "pyproject.toml").write_text(
-            '[project]\nname = "test"\n\n'
-            "[tool.agentic-dev-pipeline]\n"
-            "max-iterations = 10\n"
-        )
-        monkeypatch.setenv("MAX_ITERATIONS", "20")
-        cfg = PipelineConfig.resolve({"max_iterations": 3}, project_root=tmp_path)
-        assert cfg.max_iterations == 3
-
-    def test_pyproject_overrides_file(self, tmp_path, clean_env):
-        (tmp_path / "pyproject.toml").write_text(
-            '[project]\nname = "test"\n\n'
-            "[tool.agentic-dev-pipeline]\n"
-            "max-iterations = 7\n"
-        )
-        (tmp_path / ".agentic-dev-pipeline.toml").write_text("max-iterations = 3\n")
-        cfg = PipelineConfig.resolve(project_root=tmp_path)
-        assert cfg.max_iterations == 7
-
-    def test_file_overrides_env(self, tmp_path, clean_env, monkeypatch):
-        monkeypatch.setenv("MAX_ITERATIONS", "20")
-        (tmp_path / ".agentic-dev-pipeline.toml").write_text("max-iterations = 3\n")
-        cfg = PipelineConfig.resolve(project_root=tmp_path)
-        assert cfg.max_iterations == 3
-
-    def test_env_used_when_no_files(self, tmp_path, clean_env, monkeypatch):
-        monkeypatch.setenv("MAX_ITERATIONS", "8")
-        cfg = PipelineConfig.resolve(project_root=tmp_path)
-        assert cfg.max_iterations == 8
+    @pytest.mark.parametrize(
+        ("files", "env_max", "explicit", "expected"),
+        [
+            (
+                {"pyproject.toml": "[tool.agentic-dev-pipeline]\nmax-iterations = 10\n"},
+                "20",
+                {"max_iterations": 3},
+                3,
+            ),
+            (
+                {
+                    "pyproject.toml": "[tool.agentic-dev-pipeline]\nmax-iterations = 7\n",
+                    ".agentic-dev-pipeline.toml": "max-iterations = 3\n",
+                },
+                None,
+                None,
+                7,
+            ),
+            ({".agentic-dev-pipeline.toml": "max-iterations = 3\n"}, "20", None, 3),
+            ({}, "8", None, 8),
+        ],
+        ids=["explicit-over-all", "pyproject-over-file", "file-over-env", "env-without-files"],
+    )
+    def test_layer_precedence(
+        self, tmp_path, clean_env, monkeypatch, files, env_max, explicit, expected
+    ):
+        for name, content in files.items():
+            (tmp_path / name).write_text(content)
+        if env_max is not None:
+            monkeypatch.setenv("MAX_ITERATIONS", env_max)
+        cfg = PipelineConfig.resolve(explicit, project_root=tmp_path)
+        assert cfg.max_iterations == expected
 
     def test_unknown_toml_keys_ignored(self, tmp_path, clean_env):
         """Keys not in PipelineConfig (e.g. parallel-gates) are silently ignored."""
@@ -0,0 +1,151 @@
+"""Tests for detect_all() and the shared per-run stat cache."""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from agentic_dev_pipeline.detect import (
+    _has_makefile_target,
+    _has_npm_script,
+    _load_makefile_targets,
+    _StatCache,
+    detect_all,
+    detect_changed_files,
+    detect_lint_cmd,
+    detect_security_cmd,
+    detect_test_cmd,
+)
+
+
+class TestStatCache:
+    def test_file_and_dir(self, tmp_path):
+        (tmp_path / "f").write_text("x")
+        fs = _StatCache()
+        assert fs.is_file(tmp_path / "f")
+        assert not fs.is_dir(tmp_path / "f")
+        assert fs.is_dir(tmp_path)
+        assert not fs.is_file(tmp_path / "missing")
+
+    def test_stats_each_path_once(self, tmp_path, monkeypatch):
+        calls: list[object] = []
+        real_stat = os.stat
+        monkeypatch.setattr(
+            "agentic_dev_pipeline.detect.os.stat", lambda p: calls.append(p) or real_stat(p)
+        )
+        fs = _StatCache()
+        fs.is_file(tmp_path / "missing")
+        fs.is_dir(tmp_path / "missing")
+        assert calls == [tmp_path / "missing"]
+
+    def test_primed_directory_answers_without_stat(self, tmp_path, monkeypatch):
+        (tmp_path / "pyproject.toml").write_text("")
+        (tmp_path / "src").mkdir()
+        fs = _StatCache()
+        fs.prime(tmp_path)
+        monkeypatch.setattr("agentic_dev_pipeline.detect.os.stat", None)  # any stat would fail
+        assert fs.is_file(tmp_path / "pyproject.toml")
+        assert fs.is_dir(tmp_path / "src")
+        assert not fs.is_file(tmp_path / "package.json")
+        assert fs.stat(tmp_path / "Makefile") is None
+
+    def test_has_file_and_dir_by_name(self, tmp_path):
+        (tmp_path / "go.mod").write_text("")
+        (tmp_path / "pkg").mkdir()
+        for primed in (False, True):
+            fs = _StatCache()
+            if primed:
+                fs.prime(tmp_path)
+            assert fs.has_file(tmp_path, "go.mod")
+            assert not fs.has_file(tmp_path, "pkg")
+            assert fs.has_dir(tmp_path, "pkg")
+            assert not fs.has_dir(tmp_path, "missing")
+
+
+class TestDetectAll:
+    def test_python_project(self, python_project, clean_env):
+        cfg = detect_all(project_root=python_project)
+        assert cfg.project_type == "python"
+        assert cfg.src_dirs == "src/"
+        assert cfg.base_branch == "main"
+
+    def test_matches_individual_detectors(self, node_project, clean_env):
+        cfg = detect_all(project_root=node_project, base_branch="dev")
+        assert cfg.project_type == "node"
+        assert cfg.lint_cmd == detect_lint_cmd(project_root=node_project)
+        assert cfg.test_cmd == detect_test_cmd(project_root=node_project)
+        assert cfg.security_cmd == detect_security_cmd(project_root=node_project)
+        assert cfg.changed_files == detect_changed_files("dev", "node", node_project)
+        assert cfg.base_branch == "dev"
+
+
+class TestMakefileAndNpmCache:
+    def test_makefile_parsed_once(self, tmp_path):
+        (tmp_path / "Makefile").write_text("lint:\n\truff .\ntest:\n\tpytest\n")
+        _load_makefile_targets.cache_clear()
+        assert _has_makefile_target("lint", tmp_path)
+        assert _has_makefile_target("test", tmp_path)
+        assert not _has_makefile_target("build", tmp_path)
+        assert _load_makefile_targets.cache_info().misses == 1
+
+    def test_makefile_ignores_recipes_and_comments(self, tmp_path):
+        (tmp_path / "Makefile").write_text("# lint: disabled\nall:\n\ttest: x\n")
+        assert _has_makefile_target("all", tmp_path)
+        assert not _has_makefile_target("lint", tmp_path)
+        assert not _has_makefile_target("test", tmp_path)
+
+    def test_makefile_not_utf8(self, tmp_path):
+        (tmp_path / "Makefile").write_bytes(b"# \xff\xfe latin-1 comment\nlint:\n\techo \xe9\n")
+        assert _has_makefile_target("lint", tmp_path)
+
+    def test_makefile_edit_invalidates(self, tmp_path):
+        makefile = tmp_path / "Makefile"
+        makefile.write_text("lint:\n")
+        assert not _has_makefile_target("test", tmp_path)
+        makefile.write_text("lint:\ntest:\n")
+        os.utime(makefile, ns=(0, makefile.stat().st_mtime_ns + 1_000_000))
+        assert _has_makefile_target("test", tmp_path)
+
+    def test_npm_scripts(self, node_project):
+        assert _has_npm_script("lint", node_project)
+        assert not _has_npm_script("build", node_project)
+
+    def test_npm_without_scripts_skips_parse(self, tmp_path, monkeypatch):
+        (tmp_path / "package.json").write_text('{"name": "x"}')
+        monkeypatch.setattr("agentic_dev_pipeline.detect.json.loads", None)  # must not be called
+        assert not _has_npm_script("test", tmp_path)
+
+    def test_npm_invalid_json(self, tmp_path):
+        (tmp_path / "package.json").write_text("{not json")
+        assert not _has_npm_script("test", tmp_path)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestDetectChangedFiles:
+    def _git(self, root, *args):
+        subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+    def test_collects_staged_unstaged_and_untracked(self, tmp_path, clean_env):
+        self._git(tmp_path, "init", "-q", "-b", "main")
+        (tmp_path / "a.py").write_text("a\n")
+        self._git(tmp_path, "add", "a.py")
+        self._git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+        (tmp_path / "a.py").write_text("changed\n")
+        (tmp_path / "b.py").write_text("b\n")
+        self._git(tmp_path, "add", "b.py")
+        (tmp_path / "c.py").write_text("c\n")
+        assert detect_changed_files("main", "python", tmp_path) == ["a.py", "b.py", "c.py"]
+
+    def test_outside_repo_falls_back_to_source_files(self, tmp_path, clean_env):
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "m.py").write_text("")
+        assert detect_changed_files("main", "python", tmp_path) == [os.path.join("pkg", "m.py")]
+
+    def test_fallback_prunes_excluded_dirs(self, tmp_path, clean_env):
+        (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+        (tmp_path / "node_modules" / "dep" / "index.js").write_text("")
+        (tmp_path / "index.js").write_text("")
+        (tmp_path / "README.md").write_text("")
+        assert detect_changed_files("main", "node", tmp_path) == ["index.js"]
@@ -1,20 +1,24 @@
 """Tests for detect_instruction_files() and detect_design_docs()."""
 
+import os
+
+import pytest
+
 from agentic_dev_pipeline.detect import detect_design_docs, detect_instruction_files
 
 
 class TestDetectInstructionFiles:
-    def test_claude_md(self, tmp_path, clean_env):
-        (tmp_path / "CLAUDE.md").write_text("# Rules\n")
+    @pytest.mark.parametrize(
+        "names",
+        [["CLAUDE.md"], ["CLAUDE.md", "CONTRIBUTING.md"]],
+        ids=["claude-md", "multiple"],
+    )
+    def test_root_files(self, tmp_path, clean_env, names):
+        for name in names:
+            (tmp_path / name).write_text("# Rules\n")
         result = detect_instruction_files(tmp_path)
-        assert "CLAUDE.md" in result
-
-    def test_multiple_files(self, tmp_path, clean_env):
-        (tmp_path / "CLAUDE.md").write_text("# Rules\n")
-        (tmp_path / "CONTRIBUTING.md").write_text("# Contributing\n")
-        result = detect_instruction_files(tmp_path)
-        assert "CLAUDE.md" in result
-        assert "CONTRIBUTING.md" in result
+        assert set(names) <= set(result)
+        assert len(result) == len(set(result))
 
     def test_claude_rules_dir(self, tmp_path, clean_env):
         rules_dir = tmp_path / ".claude" / "rules"
@@ -25,6 +29,17 @@ class TestDetectInstructionFiles:
         assert any("coding.md" in f for f in result)
         assert any("testing.md" in f for f in result)
 
+    def test_claude_rules_sorted_files_only(self, tmp_path, clean_env):
+        rules_dir = tmp_path / ".claude" / "rules"
+        (rules_dir / "nested.md").mkdir(parents=True)
+        (rules_dir / "b.md").write_text("")
+        (rules_dir / "a.md").write_text("")
+        (rules_dir / "notes.txt").write_text("")
+        assert detect_instruction_files(tmp_path) == [
+            os.path.join(".claude", "rules", "a.md"),
+            os.path.join(".claude", "rules", "b.md"),
+        ]
+
     def test_no_files(self, tmp_path, clean_env):
         assert detect_instruction_files(tmp_path) == []
 
@@ -33,10 +48,11 @@ class TestDetectInstructionFiles:
         result = detect_instruction_files(tmp_path)
         assert result == ["custom.md", "rules.md"]
 
-    def test_no_duplicates(self, tmp_path, clean_env):
-        (tmp_path / "CLAUDE.md").write_text("# Rules\n")
-        result = detect_instruction_files(tmp_path)
-        assert len(result) == len(set(result))
+    def test_env_override_result_is_a_fresh_list(self, tmp_path, monkeypatch, clean_env):
+        """The split is cached; callers still get their own list to mutate."""
+        monkeypatch.setenv("INSTRUCTION_FILES", "custom.md")
+        detect_instruction_files(tmp_path).append("extra.md")
+        assert detect_instruction_files(tmp_path) == ["custom.md"]
 
 
 class TestDetectDesignDocs:
@@ -2,6 +2,8 @@
 
 import sys
 
+import pytest
+
 from agentic_dev_pipeline.detect import detect_lint_cmd
 
 
@@ -10,21 +12,26 @@ class TestDetectLintCmd:
         monkeypatch.setenv("LINT_CMD", "custom-lint .")
         assert detect_lint_cmd(project_root=tmp_path) == "custom-lint ."
 
-    def test_makefile_target(self, tmp_path, clean_env):
-        (tmp_path / "Makefile").write_text("lint:\n\techo lint\n")
-        assert detect_lint_cmd(project_root=tmp_path) == "make lint"
-
-    def test_node_npm_script(self, tmp_path, clean_env):
-        (tmp_path / "package.json").write_text(
-            '{"scripts": {"lint": "eslint ."}}\n'
-        )
-        result = detect_lint_cmd("node", project_root=tmp_path)
-        assert result == "npm run lint"
-
-    def test_rust_clippy(self, tmp_path, clean_env):
-        (tmp_path / "Cargo.toml").write_text("[package]\n")
-        result = detect_lint_cmd("rust", project_root=tmp_path)
-        assert result == "cargo clippy -- -D warnings"
+    @pytest.mark.parametrize(
+        ("files", "project_type", "expected"),
+        [
+            ({"Makefile": "lint:\n\techo lint\n"}, "unknown", "make lint"),
+            ({"package.json": '{"scripts": {"lint": "eslint ."}}\n'}, "node", "npm run lint"),
+            ({"Cargo.toml": "[package]\n"}, "rust", "cargo clippy -- -D warnings"),
+            ({}, "unknown", ""),
+            # A Makefile target takes priority over tool existence
+            (
+                {"Makefile": "lint:\n\tmy-custom-lint\n", "Cargo.toml": "[package]\n"},
+                "rust",
+                "make lint",
+            ),
+        ],
+        ids=["makefile", "npm-script", "clippy", "unknown", "makefile-first"],
+    )
+    def test_project_files(self, tmp_path, clean_env, files, project_type, expected):
+        for name, content in files.items():
+            (tmp_path / name).write_text(content)
+        assert detect_lint_cmd(project_type, project_root=tmp_path) == expected
 
     def test_go_vet_fallback(self, tmp_path, monkeypatch, clean_env, no_venv):
         """Without golangci-lint, falls back to go vet."""
@@ -34,39 +41,14 @@ class TestDetectLintCmd:
         result = detect_lint_cmd("go", project_root=tmp_path)
         assert result == "go vet ./..."
 
-    def test_unknown_project_empty(self, tmp_path, clean_env):
-        result = detect_lint_cmd("unknown", project_root=tmp_path)
-        assert result == ""
-
-    def test_makefile_priority_over_tool(self, tmp_path, clean_env):
-        """Makefile target takes priority over tool existence."""
-        (tmp_path / "Makefile").write_text("lint:\n\tmy-custom-lint\n")
-        (tmp_path / "Cargo.toml").write_text("[package]\n")
-        result = detect_lint_cmd("rust", project_root=tmp_path)
-        assert result == "make lint"
-
-    def test_ruff_in_venv_no_runner(self, tmp_path, monkeypatch, clean_env):
+    def test_ruff_in_venv_no_runner(self, tmp_path, in_fake_venv, clean_env):
         """ruff found in venv uses full path when no runner."""
-        monkeypatch.setenv("PATH", "")
-        fake_venv = tmp_path / "fake-venv"
-        bin_dir = fake_venv / "bin"
-        bin_dir.mkdir(parents=True)
-        (bin_dir / "ruff").write_text("")
-        (bin_dir / "ruff").chmod(0o755)
-        monkeypatch.setattr(sys, "prefix", str(fake_venv))
-        monkeypatch.setattr(sys, "base_prefix", "/usr")
-
         (tmp_path / "src").mkdir()
         result = detect_lint_cmd("python", project_root=tmp_path)
-        assert result == f"{bin_dir / 'ruff'} check src/"
+        assert result == f"{in_fake_venv / 'ruff'} check src/"
 
-    def test_ruff_in_venv_with_runner(self, tmp_path, monkeypatch, clean_env):
+    def test_ruff_in_venv_with_runner(self, tmp_path, fake_venv, monkeypatch, clean_env):
         """ruff with uv runner uses 'uv run ruff' (not venv path)."""
-        fake_venv = tmp_path / "fake-venv"
-        bin_dir = fake_venv / "bin"
-        bin_dir.mkdir(parents=True)
-        (bin_dir / "ruff").write_text("")
-        (bin_dir / "ruff").chmod(0o755)
         monkeypatch.setattr(sys, "prefix", str(fake_venv))
         monkeypatch.setattr(sys, "base_prefix", "/usr")
 
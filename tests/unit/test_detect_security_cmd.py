@@ -1,7 +1,5 @@
 """Tests for detect_security_cmd()."""
 
-import sys
-
 from agentic_dev_pipeline.detect import detect_security_cmd
 
 
@@ -26,17 +24,8 @@ class TestDetectSecurityCmd:
         result = detect_security_cmd("unknown", project_root=tmp_path)
         assert result == ""
 
-    def test_bandit_in_venv_no_runner(self, tmp_path, monkeypatch, clean_env):
+    def test_bandit_in_venv_no_runner(self, tmp_path, in_fake_venv, clean_env):
         """bandit found in venv uses full path when no runner."""
-        monkeypatch.setenv("PATH", "")
-        fake_venv = tmp_path / "fake-venv"
-        bin_dir = fake_venv / "bin"
-        bin_dir.mkdir(parents=True)
-        (bin_dir / "bandit").write_text("")
-        (bin_dir / "bandit").chmod(0o755)
-        monkeypatch.setattr(sys, "prefix", str(fake_venv))
-        monkeypatch.setattr(sys, "base_prefix", "/usr")
-
         (tmp_path / "src").mkdir()
         result = detect_security_cmd("python", project_root=tmp_path)
-        assert result == f"{bin_dir / 'bandit'} -r src/ -q"
+        assert result == f"{in_fake_venv / 'bandit'} -r src/ -q"
@@ -1,26 +1,26 @@
 """Tests for detect_src_dirs()."""
 
-from agentic_dev_pipeline.detect import detect_src_dirs
+import os
 
+import pytest
 
-class TestDetectSrcDirs:
-    def test_src_dir(self, tmp_path, clean_env):
-        (tmp_path / "src").mkdir()
-        assert detect_src_dirs(tmp_path) == "src/"
+from agentic_dev_pipeline.detect import detect_src_dirs
 
-    def test_multiple_dirs(self, tmp_path, clean_env):
-        (tmp_path / "src").mkdir()
-        (tmp_path / "lib").mkdir()
-        result = detect_src_dirs(tmp_path)
-        assert "src/" in result
-        assert "lib/" in result
 
-    def test_all_dirs(self, tmp_path, clean_env):
-        for d in ("src", "app", "lib", "pkg"):
-            (tmp_path / d).mkdir()
-        result = detect_src_dirs(tmp_path)
-        for d in ("src/", "app/", "lib/", "pkg/"):
-            assert d in result
+class TestDetectSrcDirs:
+    @pytest.mark.parametrize(
+        ("dirs", "expected"),
+        [
+            (["src"], "src/"),
+            (["lib", "src"], "src/ lib/"),
+            (["pkg", "lib", "app", "src"], "src/ app/ lib/ pkg/"),
+        ],
+        ids=["src", "multiple", "all"],
+    )
+    def test_candidate_dirs(self, tmp_path, clean_env, dirs, expected):
+        for d in dirs:
+            os.mkdir(tmp_path / d)
+        assert detect_src_dirs(tmp_path) == expected
 
     def test_no_dirs_fallback_to_dot(self, tmp_path, clean_env):
         assert detect_src_dirs(tmp_path) == "."
@@ -1,7 +1,5 @@
 """Tests for detect_test_cmd()."""
 
-import sys
-
 from agentic_dev_pipeline.detect import detect_test_cmd
 
 
@@ -40,16 +38,7 @@ class TestDetectTestCmd:
         result = detect_test_cmd("python", project_root=tmp_path)
         assert "unittest" in result
 
-    def test_pytest_in_venv_no_runner(self, tmp_path, monkeypatch, clean_env):
+    def test_pytest_in_venv_no_runner(self, tmp_path, in_fake_venv, clean_env):
         """pytest found in venv uses full path when no runner."""
-        monkeypatch.setenv("PATH", "")
-        fake_venv = tmp_path / "fake-venv"
-        bin_dir = fake_venv / "bin"
-        bin_dir.mkdir(parents=True)
-        (bin_dir / "pytest").write_text("")
-        (bin_dir / "pytest").chmod(0o755)
-        monkeypatch.setattr(sys, "prefix", str(fake_venv))
-        monkeypatch.setattr(sys, "base_prefix", "/usr")
-
         result = detect_test_cmd("python", project_root=tmp_path)
-        assert result == f"{bin_dir / 'pytest'} -q"
+        assert result == f"{in_fake_venv / 'pytest'} -q"
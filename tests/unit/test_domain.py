@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from agentic_dev_pipeline.domain import (
     TRIANGULAR_PASS_MARKER,
     GateResult,
@@ -22,6 +24,11 @@ class TestGateStatus:
     def test_from_value(self):
         assert GateStatus("pass") is GateStatus.PASS
 
+    def test_is_str(self):
+        assert GateStatus.PASS == "pass"
+        assert f"{GateStatus.FAIL}" == "fail"
+        assert json.dumps({"s": GateStatus.SKIPPED}) == '{"s": "skipped"}'
+
 
 class TestIterationOutcome:
     def test_values(self):
@@ -43,6 +50,12 @@ class TestGateResult:
         assert g.output == ""
         assert g.duration_s == 0.0
 
+    def test_slots_reject_unknown_attributes(self):
+        g = GateResult()
+        assert not hasattr(g, "__dict__")
+        with pytest.raises(AttributeError):
+            g.nmae = "typo"  # type: ignore[attr-defined]
+
 
 class TestIterationMetrics:
     def test_lint_result_from_gate_results(self):
@@ -56,6 +69,16 @@ class TestIterationMetrics:
         assert m.test_result == "fail"
         assert m.security_result == "skipped"
 
+    def test_first_result_wins_for_duplicate_names(self):
+        m = IterationMetrics(
+            gate_results=[
+                GateResult(name="lint", status=GateStatus.FAIL),
+                GateResult(name="lint", status=GateStatus.PASS),
+            ]
+        )
+        assert m.lint_result == "fail"
+        assert m.to_dict()["lint_result"] == "fail"
+
     def test_plugin_results_excludes_builtins(self):
         m = IterationMetrics(
             gate_results=[
@@ -85,15 +108,20 @@ class TestIterationMetrics:
             verification_status=GateStatus.PASS,
             outcome=IterationOutcome.PASS,
         )
+        expected = {
+            "iteration": 1,
+            "lint_result": "pass",
+            "test_result": "pass",
+            "security_result": "skipped",
+            "plugin_results": [],
+            "verification_result": "pass",
+            "outcome": "pass",
+            "phase1_done": True,
+        }
         d = m.to_dict()
-        assert d["iteration"] == 1
-        assert d["lint_result"] == "pass"
-        assert d["test_result"] == "pass"
-        assert d["security_result"] == "skipped"
-        assert d["plugin_results"] == []
-        assert d["verification_result"] == "pass"
-        assert d["outcome"] == "pass"
-        assert d["phase1_done"] is True
+        assert {k: d[k] for k in expected} == expected
+        # Plain str, not the enum members, so the public types are unchanged
+        assert all(type(d[k]) is str for k in ("lint_result", "verification_result", "outcome"))
 
     def test_to_dict_empty_outcome(self):
         m = IterationMetrics()
@@ -117,11 +145,10 @@ class TestPipelineMetrics:
                 ),
             ],
         )
+        expected = {"converged": True, "total_iterations": 1}
         d = pm.to_dict()
-        assert d["converged"] is True
-        assert d["total_iterations"] == 1
-        assert len(d["iterations"]) == 1
-        assert d["iterations"][0]["lint_result"] == "pass"
+        assert {k: d[k] for k in expected} == expected
+        assert [it["lint_result"] for it in d["iterations"]] == ["pass"]
 
     def test_save_produces_valid_json(self, tmp_path):
         pm = PipelineMetrics(
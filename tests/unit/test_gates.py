@@ -0,0 +1,151 @@
+"""Tests for pattern gates (PatternGateBatch)."""
+
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agentic_dev_pipeline import gates
+from agentic_dev_pipeline.gates import PatternGateBatch, _walk
+
+
+class TestPatternGateBatch:
+    def test_passes_when_pattern_absent(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("x = 1\n")
+        batch = PatternGateBatch([tmp_path / "src"], base=tmp_path)
+        passed, output = batch.gate("TODO")()
+        assert passed is True
+        assert "No 'TODO' found" in output
+
+    def test_reports_path_and_line(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("x = 1\n# TODO: fix\n")
+        batch = PatternGateBatch([tmp_path / "src"], base=tmp_path)
+        passed, output = batch.gate("TODO")()
+        assert passed is False
+        assert "src/main.py:2:# TODO: fix" in output
+
+    def test_one_hit_per_line(self, tmp_path):
+        (tmp_path / "a.py").write_text("print(1); print(2)\n")
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        batch.gate("print(")
+        assert batch.scan()[b"print("] == [("a.py", 1, "print(1); print(2)")]
+
+    def test_overlapping_patterns(self, tmp_path):
+        (tmp_path / "a.py").write_text("# TODO: later\n")
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        todo = batch.gate("TODO")
+        todo_colon = batch.gate("TODO:")
+        assert todo()[0] is False
+        assert todo_colon()[0] is False
+
+    def test_skips_binary_files(self, tmp_path):
+        (tmp_path / "blob.bin").write_bytes(b"\0TODO")
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        assert batch.gate("TODO")()[0] is True
+
+    def test_gates_share_one_scan(self, tmp_path, monkeypatch):
+        (tmp_path / "a.py").write_text("print('x')  # TODO\n")
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        gates = [batch.gate("TODO"), batch.gate("print(")]
+
+        scans = []
+        original = batch._scan
+        monkeypatch.setattr(batch, "_scan", lambda: scans.append(1) or original())
+        assert [g()[0] for g in gates] == [False, False]
+        assert len(scans) == 1
+
+    def test_concurrent_gates_share_one_scan(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(gates, "MAX_MATCHES", 1)
+        (tmp_path / "a.py").write_text("# TODO\n# TODO\nprint(1)\n")
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        todo, prints = batch.gate("TODO"), batch.gate("print(")
+
+        scans = []
+        original = batch._scan
+        monkeypatch.setattr(batch, "_scan", lambda: scans.append(1) or original())
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            (_, todo_out), (_, print_out) = pool.map(lambda g: g(), [todo, prints])
+        assert len(scans) == 1
+        assert "truncated" in todo_out
+        assert "truncated" not in print_out
+
+    def test_rescans_after_change(self, tmp_path):
+        target = tmp_path / "a.py"
+        target.write_text("x = 1\n")
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        gate = batch.gate("TODO")
+        assert gate()[0] is True
+        (tmp_path / "b.py").write_text("# TODO\n")
+        assert gate()[0] is False
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_gitignored_files_skipped(self, tmp_path):
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / ".gitignore").write_text("ignored/\n")
+        (tmp_path / "ignored").mkdir()
+        (tmp_path / "ignored" / "vendored.py").write_text("# TODO\n")
+        (tmp_path / "main.py").write_text("# TODO\n")
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        batch.gate("TODO")
+        assert batch.scan()[b"TODO"] == [("main.py", 1, "# TODO")]
+
+    def test_hits_capped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(gates, "MAX_MATCHES", 3)
+        (tmp_path / "a.py").write_text("# TODO\n" * 10)
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        passed, output = batch.gate("TODO")()
+        assert passed is False
+        assert [h[1] for h in batch.scan()[b"TODO"]] == [1, 2, 3]
+        assert "truncated after 3 matches" in output
+
+
+class TestCallGate:
+    def test_finds_real_calls_only(self, tmp_path):
+        (tmp_path / "a.py").write_text(
+            """\
+# print(x)
+s = "print(x)"
+sprint(1)
+log.print(2)
+print (3)
+"""
+        )
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        passed, output = batch.call_gate("print")()
+        assert passed is False
+        assert [h[1] for h in batch.scan()["print"]] == [5]
+        assert "a.py:5:print (3)" in output
+
+    def test_non_python_files_ignored(self, tmp_path):
+        (tmp_path / "notes.txt").write_text("print(1)\n")
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        passed, output = batch.call_gate("print")()
+        assert passed is True
+        assert "No call to print() found" in output
+
+    def test_unparsable_file_does_not_raise(self, tmp_path):
+        (tmp_path / "a.py").write_text("print(1)\nx = (\n")
+        batch = PatternGateBatch([tmp_path], base=tmp_path)
+        batch.call_gate("print")
+        assert [h[1] for h in batch.scan()["print"]] == [1]
+
+    def test_rejects_non_identifier(self, tmp_path):
+        with pytest.raises(ValueError, match="identifier"):
+            PatternGateBatch([tmp_path]).call_gate("print(")
+
+
+class TestWalk:
+    def test_skips_vendored_dirs(self, tmp_path):
+        for d in ("src", ".venv/lib", "node_modules/pkg", "src/__pycache__"):
+            (tmp_path / d).mkdir(parents=True)
+        (tmp_path / "src" / "main.py").write_text("# TODO\n")
+        (tmp_path / ".venv" / "lib" / "dep.py").write_text("# TODO\n")
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("// TODO\n")
+        (tmp_path / "src" / "__pycache__" / "main.pyc").write_text("TODO")
+        files = {os.path.relpath(e.path, tmp_path) for e in _walk(str(tmp_path)) if e.is_file()}
+        assert files == {os.path.join("src", "main.py")}
@@ -1,15 +1,26 @@
 """Tests for the Logger."""
 
 import json
+import time
+from collections.abc import Iterator
+
+import pytest
 
 from agentic_dev_pipeline.log import Logger
 
 
+@pytest.fixture(scope="class")
+def json_logger(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Logger]:
+    """One JSON-mode Logger shared by a class's stdout-only tests."""
+    with Logger(log_file=tmp_path_factory.mktemp("logs") / "t.log", json_mode=True) as logger:
+        yield logger
+
+
 class TestLogger:
     def test_text_mode(self, tmp_path, capsys):
         log_file = tmp_path / "test.log"
-        logger = Logger(log_file=log_file, json_mode=False)
-        logger.info("hello world")
+        with Logger(log_file=log_file, json_mode=False) as logger:
+            logger.info("hello world")
 
         captured = capsys.readouterr()
         assert "hello world" in captured.out
@@ -17,17 +28,14 @@ class TestLogger:
         content = log_file.read_text()
         assert "hello world" in content
 
-    def test_json_mode(self, tmp_path, capsys):
-        log_file = tmp_path / "test.log"
-        logger = Logger(log_file=log_file, json_mode=True)
-        logger.info("hello json")
+    def test_json_mode(self, json_logger, capsys):
+        json_logger.info("hello json")
 
-        captured = capsys.readouterr()
-        record = json.loads(captured.out.strip())
-        assert record["msg"] == "hello json"
-        assert record["level"] == "info"
-        assert "ts" in record
-        assert "elapsed_s" in record
+        out = capsys.readouterr().out
+        assert '"msg": "hello json"' in out
+        assert '"level": "info"' in out
+        assert '"ts": "' in out
+        assert '"elapsed_s": ' in out
 
     def test_warn_to_stderr(self, tmp_path, capsys):
         logger = Logger(json_mode=False)
@@ -37,11 +45,11 @@ class TestLogger:
         assert "warning!" in captured.err
         assert captured.out == ""
 
-    def test_phase_events(self, tmp_path, capsys):
-        logger = Logger(json_mode=True)
-        logger.phase_start("test_phase", iteration=1)
-        logger.phase_end("test_phase", "pass", iteration=1)
+    def test_phase_events(self, json_logger, capsys):
+        json_logger.phase_start("test_phase", iteration=1)
+        json_logger.phase_end("test_phase", "pass", iteration=1)
 
+        # Full parse here doubles as the check that each line is valid JSON
         lines = capsys.readouterr().out.strip().splitlines()
         start = json.loads(lines[0])
         end = json.loads(lines[1])
@@ -57,6 +65,55 @@ class TestLogger:
 
     def test_creates_parent_dirs(self, tmp_path):
         log_file = tmp_path / "deep" / "nested" / "test.log"
-        logger = Logger(log_file=log_file)
-        logger.info("deep")
-        assert log_file.parent.exists()
+        Logger(log_file=log_file)
+        assert log_file.parent.is_dir()
+        assert not log_file.exists()  # opened on the first write
+
+    def test_file_stays_open_between_lines(self, tmp_path):
+        log_file = tmp_path / "test.log"
+        with Logger(log_file=log_file, json_mode=False) as logger:
+            logger.info("one")
+            fp = logger._fp
+            logger.info("two")
+            assert logger._fp is fp
+        assert logger._fp is None
+        assert log_file.read_text().count("\n") == 2
+
+    def test_buffered_until_flush_points(self, tmp_path):
+        log_file = tmp_path / "test.log"
+        with Logger(log_file=log_file, json_mode=False) as logger:
+            logger.info("one")
+            logger.phase_start("p")
+            assert log_file.read_text() == ""
+            logger.phase_end("p", "pass")
+            assert log_file.read_text().count("\n") == 3
+            logger.info("two")
+            logger.flush()
+            assert log_file.read_text().count("\n") == 4
+            logger.warn("careful")
+            assert log_file.read_text().endswith("careful\n")
+
+    def test_reopens_after_close(self, tmp_path):
+        log_file = tmp_path / "test.log"
+        logger = Logger(log_file=log_file, json_mode=False)
+        logger.info("one")
+        logger.close()
+        logger.info("two")
+        logger.close()
+        lines = log_file.read_text().splitlines()
+        assert [line.split("] ", 1)[1] for line in lines] == ["one", "two"]
+
+    def test_timestamp_formatted_once_per_second(self, monkeypatch, capsys):
+        calls: list[str] = []
+        real_strftime = time.strftime
+        monkeypatch.setattr(
+            "agentic_dev_pipeline.log.time.strftime",
+            lambda fmt, t: calls.append(fmt) or real_strftime(fmt, t),
+        )
+        monkeypatch.setattr("agentic_dev_pipeline.log.time.time", lambda: 1_700_000_000.25)
+        logger = Logger(json_mode=False)
+        logger.info("one")
+        logger.info("two")
+        assert len(calls) == 2  # one json + one text format for that second
+        out = capsys.readouterr().out.splitlines()
+        assert out[0][:10] == out[1][:10]
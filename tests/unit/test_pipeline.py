@@ -1,61 +1,171 @@
 """Tests for pipeline module."""
 
-import stat
+import http.client
+import json
+import os
+import signal
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
+import pytest
+
+from agentic_dev_pipeline.domain import GateStatus, sequential_gate
+from agentic_dev_pipeline.log import Logger
 from agentic_dev_pipeline.pipeline import (
+    _GATE_OUTPUT_LIMIT,
+    _gate_argv,
     _is_safe_command,
     _load_plugins,
     _run_callable_gate,
     _run_gate_command,
+    _run_gates_parallel,
+    _run_implementation_phase,
+    _run_quality_gates,
+    _send_webhook,
+    _SignalGuard,
 )
+from agentic_dev_pipeline.runner import CliClaudeRunner
 
 
 class TestSafeCommand:
-    def test_simple_command(self):
-        assert _is_safe_command("ruff check src/") is True
-
-    def test_make_command(self):
-        assert _is_safe_command("make lint") is True
-
-    def test_npm_command(self):
-        assert _is_safe_command("npm test") is True
+    @pytest.mark.parametrize(
+        ("cmd", "expected"),
+        [
+            ("ruff check src/", True),
+            ("make lint", True),
+            ("npm test", True),
+            ("echo $(rm -rf /)", False),
+            ("echo `rm -rf /`", False),
+            ("cat > /dev/sda", False),
+            ("echo hi; rm -rf /", False),
+            ("echo hi && rm -rf /", False),
+        ],
+    )
+    def test_is_safe_command(self, cmd, expected):
+        assert _is_safe_command(cmd) is expected
 
-    def test_command_substitution_dollar(self):
-        assert _is_safe_command("echo $(rm -rf /)") is False
+    def test_memoized(self):
+        _is_safe_command.cache_clear()
+        for _ in range(3):
+            assert _is_safe_command("pytest -q") is True
+        assert _is_safe_command.cache_info().hits == 2
 
-    def test_command_substitution_backtick(self):
-        assert _is_safe_command("echo `rm -rf /`") is False
 
-    def test_redirect_to_dev(self):
-        assert _is_safe_command("cat > /dev/sda") is False
+class TestRunGateCommand:
+    @pytest.fixture
+    def fake_run(self, monkeypatch):
+        """Answer subprocess.run in-process with the given result, or raise it."""
+        calls: list[object] = []
 
-    def test_semicolon_rm(self):
-        assert _is_safe_command("echo hi; rm -rf /") is False
+        def install(result):
+            def run(args, **kwargs):
+                calls.append(args)
+                if isinstance(result, BaseException):
+                    raise result
+                return subprocess.CompletedProcess(args, *result)
 
-    def test_and_rm(self):
-        assert _is_safe_command("echo hi && rm -rf /") is False
+            monkeypatch.setattr("agentic_dev_pipeline.pipeline.subprocess.run", run)
+            return calls
 
+        return install
 
-class TestRunGateCommand:
     def test_successful_command(self):
+        """The one real spawn: exec path end to end."""
         passed, output = _run_gate_command("echo hello")
         assert passed is True
         assert "hello" in output
 
-    def test_failing_command(self):
+    def test_failing_command(self, fake_run):
+        calls = fake_run((1, b"", b""))
         passed, _output = _run_gate_command("false")
         assert passed is False
+        assert calls == [["false"]]
+
+    def test_non_utf8_output_replaced(self, fake_run):
+        fake_run((0, b"bad \xff byte", b""))
+        passed, output = _run_gate_command("lint")
+        assert passed is True
+        assert "bad \ufffd byte" in output
+
+    def test_passing_output_truncated(self, fake_run):
+        fake_run((0, ("é" * 5000).encode(), b""))
+        passed, output = _run_gate_command("lint")
+        assert passed is True
+        assert output == "é" * _GATE_OUTPUT_LIMIT
+
+    def test_passing_output_includes_stderr(self, fake_run):
+        fake_run((0, b"", b"warn"))
+        passed, output = _run_gate_command("lint")
+        assert passed is True
+        assert output == "warn"
+
+    def test_failing_output_kept_whole(self, fake_run):
+        fake_run((1, b"x" * 5000 + b"\n", b""))
+        passed, output = _run_gate_command("lint")
+        assert passed is False
+        assert output == "x" * 5000 + "\n"
 
-    def test_unsafe_command_blocked(self):
+    def test_unsafe_command_blocked(self, fake_run):
+        calls = fake_run((0, b"", b""))
         passed, output = _run_gate_command("echo $(cat /etc/passwd)")
         assert passed is False
         assert "BLOCKED" in output
+        assert calls == []
 
-    def test_timeout(self):
+    def test_timeout(self, fake_run):
+        fake_run(subprocess.TimeoutExpired("sleep 10", 1))
         passed, output = _run_gate_command("sleep 10", timeout=1)
         assert passed is False
         assert "timed out" in output
 
+    @pytest.mark.slow
+    def test_timeout_kills_real_process(self):
+        """End-to-end timeout wiring; waits out the real 1s limit."""
+        passed, output = _run_gate_command("sleep 10", timeout=1)
+        assert passed is False
+        assert output == "Command timed out after 1s: sleep 10"
+
+    def test_shell_syntax_still_supported(self):
+        passed, output = _run_gate_command("echo one | tr a-z A-Z")
+        assert passed is True
+        assert "ONE" in output
+
+    def test_shell_keyword_gate(self):
+        """Words that are not programs on PATH still run through the shell."""
+        assert _run_gate_command("! false") == (True, "")
+
+    def test_missing_program(self):
+        passed, output = _run_gate_command("no-such-gate-tool-xyz --check")
+        assert passed is False
+        assert "not found" in output
+
+
+class TestGateArgv:
+    def test_plain_command_split(self):
+        assert _gate_argv("ls -l 'src dir/'") == ["ls", "-l", "src dir/"]
+
+    @pytest.mark.parametrize(
+        "cmd",
+        [
+            "a | b",
+            "a > out",
+            "a *.py",
+            "FOO=1 pytest",
+            "cd x",
+            "a && b",
+            "! grep -rq TODO src",
+            "command -v ruff",
+            "no-such-gate-tool-xyz --check",
+        ],
+    )
+    def test_needs_shell(self, cmd):
+        assert _gate_argv(cmd) is None
+
+    def test_option_with_equals_is_plain(self):
+        assert _gate_argv("ls --color=never src/") == ["ls", "--color=never", "src/"]
+
 
 class TestLoadPlugins:
     def test_empty_dir(self, tmp_path):
@@ -65,11 +175,8 @@ class TestLoadPlugins:
         assert _load_plugins("") == []
         assert _load_plugins(None) == []
 
-    def test_sh_plugins(self, tmp_path):
-        (tmp_path / "lint-extra.sh").write_text("#!/bin/bash\necho ok\n")
-        (tmp_path / "lint-extra.sh").chmod(
-            (tmp_path / "lint-extra.sh").stat().st_mode | stat.S_IEXEC
-        )
+    def test_sh_plugins(self, tmp_path, write_exec):
+        write_exec(tmp_path / "lint-extra.sh", b"#!/bin/bash\necho ok\n")
         result = _load_plugins(str(tmp_path))
         assert len(result) == 1
         assert result[0][0] == "lint-extra"
@@ -87,12 +194,29 @@ class TestLoadPlugins:
         (tmp_path / "data.json").write_text("{}\n")
         assert _load_plugins(str(tmp_path)) == []
 
+    def test_path_is_a_file(self, tmp_path):
+        (tmp_path / "x.sh").write_text("")
+        assert _load_plugins(str(tmp_path / "x.sh")) == []
+
+    def test_command_uses_plugin_path(self, tmp_path):
+        (tmp_path / "check.sh").write_text("echo ok\n")
+        (tmp_path / "sub.py").mkdir()  # directories are skipped
+        assert _load_plugins(f"{tmp_path}/") == [("check", f"bash {tmp_path / 'check.sh'}")]
+
+    def test_path_with_spaces_runs_without_shell(self, tmp_path):
+        pdir = tmp_path / "my plugins"
+        pdir.mkdir()
+        (pdir / "check.sh").write_text("echo plugin ran\n")
+        [(_, cmd)] = _load_plugins(str(pdir))
+        assert _gate_argv(cmd) == ["bash", str(pdir / "check.sh")]
+        assert _run_gate_command(cmd) == (True, "plugin ran\n")
+
     def test_sorted_order(self, tmp_path):
-        (tmp_path / "z-check.sh").write_text("echo z\n")
-        (tmp_path / "a-check.sh").write_text("echo a\n")
+        # Only names matter here; empty files skip the write entirely
+        for name in ("z-check.sh", "m-check.py", "a-check.sh"):
+            (tmp_path / name).touch()
         result = _load_plugins(str(tmp_path))
-        assert result[0][0] == "a-check"
-        assert result[1][0] == "z-check"
+        assert [name for name, _ in result] == ["a-check", "m-check", "z-check"]
 
 
 class TestRunCallableGate:
@@ -114,3 +238,329 @@ class TestRunCallableGate:
         assert passed is False
         assert "boom" in output
         assert "Gate 'test' raised" in output
+
+
+class TestRunGatesParallel:
+    def test_collects_all_results(self):
+        passed, output, results = _run_gates_parallel(
+            gates=[("echo", "echo ok")],
+            callable_gates=[("good", lambda: (True, "")), ("bad", lambda: (False, "nope"))],
+            timeout=10,
+            logger=Logger(),
+        )
+        assert passed is False
+        assert "callable:bad FAILED:\nnope" in output
+        statuses = {r.name: r.status for r in results}
+        assert statuses == {
+            "echo": GateStatus.PASS,
+            "callable:good": GateStatus.PASS,
+            "callable:bad": GateStatus.FAIL,
+        }
+
+    def test_sequential_gate_runs_alone_after_pool(self):
+        order: list[str] = []
+
+        def pooled():
+            order.append("pooled")
+            return True, ""
+
+        @sequential_gate
+        def migrate():
+            order.append("migrate")
+            assert threading.current_thread() is threading.main_thread()
+            return True, ""
+
+        passed, _, _ = _run_gates_parallel(
+            gates=[],
+            callable_gates=[("migrate", migrate), ("a", pooled), ("b", pooled)],
+            timeout=10,
+            logger=Logger(),
+        )
+        assert passed is True
+        assert order == ["pooled", "pooled", "migrate"]
+
+    def test_results_in_declaration_order(self):
+        release = threading.Event()
+
+        def slow():
+            release.wait(5)
+            return False, "slow"
+
+        def fast():
+            release.set()
+            return False, "fast"
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            passed, output, results = _run_gates_parallel(
+                gates=[("echo", "echo ok")],
+                callable_gates=[("slow", slow), ("fast", fast)],
+                timeout=10,
+                logger=Logger(),
+                executor=executor,
+            )
+        assert passed is False
+        assert [r.name for r in results] == ["echo", "callable:slow", "callable:fast"]
+        assert output == "callable:slow FAILED:\nslow\n\ncallable:fast FAILED:\nfast"
+
+    def test_gates_run_concurrently(self):
+        # Each gate waits for all three to have started; serialised gates would
+        # break the barrier and fail
+        barrier = threading.Barrier(3, timeout=5)
+
+        def gate():
+            barrier.wait()
+            return True, ""
+
+        passed, output, _ = _run_gates_parallel(
+            gates=[],
+            callable_gates=[("a", gate), ("b", gate), ("c", gate)],
+            timeout=10,
+            logger=Logger(),
+        )
+        assert passed is True, output
+
+    def test_reuses_given_executor(self):
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="gate") as executor:
+            names: list[str] = []
+
+            def gate():
+                names.append(threading.current_thread().name)
+                return True, ""
+
+            for _ in range(3):
+                passed, _, _ = _run_gates_parallel(
+                    gates=[],
+                    callable_gates=[("a", gate), ("b", gate)],
+                    timeout=10,
+                    logger=Logger(),
+                    executor=executor,
+                )
+                assert passed is True
+            # Still usable: the helper must not shut down a pool it was handed
+            assert executor.submit(lambda: 1).result() == 1
+        assert len(names) == 6
+        assert all(n.startswith("gate_") for n in names)
+
+
+class TestRunImplementationPhase:
+    class _Runner:
+        def __init__(self):
+            self.prompts: list[str] = []
+
+        def run(self, prompt, *, timeout=300, max_retries=2, logger=None):
+            self.prompts.append(prompt)
+            return "out\n"
+
+    def _run(self, tmp_path, iteration, runner):
+        with Logger() as logger:
+            _run_implementation_phase(
+                iteration=iteration,
+                prompt_file=tmp_path / "PROMPT.md",
+                feedback_file=tmp_path / "feedback.txt",
+                runner=runner,
+                log_path=tmp_path / "run.log",
+                timeout=10,
+                max_retries=1,
+                logger=logger,
+            )
+
+    def test_first_iteration_sends_prompt(self, tmp_path):
+        (tmp_path / "PROMPT.md").write_text("build it")
+        runner = self._Runner()
+        self._run(tmp_path, 1, runner)
+        assert runner.prompts == ["build it"]
+        assert (tmp_path / "run.log").read_text() == "out\n"
+
+    def test_feedback_included(self, tmp_path):
+        (tmp_path / "feedback.txt").write_text("lint FAILED")
+        runner = self._Runner()
+        self._run(tmp_path, 2, runner)
+        assert "lint FAILED" in runner.prompts[0]
+
+    def test_missing_feedback(self, tmp_path):
+        runner = self._Runner()
+        self._run(tmp_path, 2, runner)
+        assert "No specific feedback available" in runner.prompts[0]
+
+    def test_cli_subclass_without_sink_returns_output(self, tmp_path):
+        class _Subclass(CliClaudeRunner):
+            def run(self, prompt, *, timeout=300, max_retries=2, logger=None):
+                return "subclass out\n"
+
+        (tmp_path / "PROMPT.md").write_text("build it")
+        self._run(tmp_path, 1, _Subclass())
+        assert (tmp_path / "run.log").read_text() == "subclass out\n"
+
+    def test_runner_declaring_sink_writes_to_log_fd(self, tmp_path):
+        class _SinkRunner:
+            def run(self, prompt, *, timeout=300, max_retries=2, logger=None, stdout_sink=None):
+                os.write(stdout_sink, b"streamed\n")
+                return ""
+
+        (tmp_path / "PROMPT.md").write_text("build it")
+        self._run(tmp_path, 1, _SinkRunner())
+        assert (tmp_path / "run.log").read_text() == "streamed\n"
+
+
+class TestSignalGuard:
+    def test_installs_and_restores_on_main_thread(self):
+        before = signal.getsignal(signal.SIGTERM)
+        with Logger() as logger, _SignalGuard(logger) as guard:
+            assert signal.getsignal(signal.SIGTERM) == guard._handle
+            signal.raise_signal(signal.SIGTERM)
+            assert guard.shutdown_requested is True
+        assert signal.getsignal(signal.SIGTERM) is before
+
+    def test_inert_off_main_thread(self):
+        errors: list[BaseException] = []
+
+        def work():
+            try:
+                with Logger() as logger, _SignalGuard(logger) as guard:
+                    assert guard.shutdown_requested is False
+            except BaseException as e:  # surfaced to the main thread below
+                errors.append(e)
+
+        t = threading.Thread(target=work)
+        t.start()
+        t.join()
+        assert errors == []
+
+
+class TestRunQualityGates:
+    def test_single_gate_runs_inline(self):
+        threads: list[threading.Thread] = []
+
+        def gate():
+            threads.append(threading.current_thread())
+            return True, ""
+
+        with Logger() as logger:
+            passed, _, results = _run_quality_gates(
+                gates=[],
+                callable_gates=[("only", gate)],
+                use_parallel=True,
+                timeout=10,
+                logger=logger,
+            )
+        assert passed is True
+        assert [r.name for r in results] == ["callable:only"]
+        assert threads == [threading.main_thread()]
+
+
+class TestSendWebhook:
+    def _server(self, received):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                received.append((self.client_address[1], json.loads(body)))
+                self.send_response(204)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        # shutdown() waits for the next poll; the 0.5s default dominated the test
+        threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+        return server
+
+    @pytest.mark.slow
+    def test_reuses_connection(self, monkeypatch):
+        for var in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setattr("agentic_dev_pipeline.pipeline._webhook_conns", {})
+        received: list[tuple[int, dict]] = []
+        server = self._server(received)
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/hook"
+            _send_webhook(url, {"n": 1})
+            _send_webhook(url, {"n": 2})
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert [p for _, p in received] == [{"n": 1}, {"n": 2}]
+        assert received[0][0] == received[1][0]  # same client port: one TCP connection
+
+    @pytest.mark.slow
+    def test_redirect_followed(self, monkeypatch):
+        for var in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setattr("agentic_dev_pipeline.pipeline._webhook_conns", {})
+        paths: list[str] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, status, location=None):
+                paths.append(f"{self.command} {self.path}")
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                self.send_response(status)
+                if location:
+                    self.send_header("Location", location)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_POST(self):
+                self._reply(*((301, "/new") if self.path == "/old" else (204,)))
+
+            def do_GET(self):
+                self._reply(204)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+        try:
+            _send_webhook(f"http://127.0.0.1:{server.server_port}/old", {"n": 1})
+        finally:
+            server.shutdown()
+            server.server_close()
+        # Same as urlopen before pooling: the redirect target is requested
+        assert paths[-1].endswith(" /new")
+
+    @pytest.mark.parametrize(
+        ("error", "posts"),
+        [(TimeoutError("timed out"), 1), (http.client.RemoteDisconnected("closed"), 2)],
+        ids=["timeout-not-resent", "stale-keepalive-retried"],
+    )
+    def test_retry_only_on_stale_connection(self, monkeypatch, error, posts):
+        for var in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+            monkeypatch.delenv(var, raising=False)
+        requests: list[str] = []
+
+        class _Response:
+            status = 204
+
+            def read(self):
+                return b""
+
+        class _Conn:
+            def __init__(self, *args, fail=None, **kwargs):
+                self.fail = fail
+
+            def request(self, method, path, **kwargs):
+                requests.append(path)
+
+            def getresponse(self):
+                if self.fail is not None:
+                    raise self.fail
+                return _Response()
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(
+            "agentic_dev_pipeline.pipeline._webhook_conns",
+            {("http", "127.0.0.1:9"): _Conn(fail=error)},  # the reused connection
+        )
+        monkeypatch.setattr("agentic_dev_pipeline.pipeline.http.client.HTTPConnection", _Conn)
+        _send_webhook("http://127.0.0.1:9/hook", {"n": 1})
+        assert requests == ["/hook"] * posts
+
+    def test_unreachable_never_raises(self):
+        _send_webhook("http://127.0.0.1:9/hook", {"n": 1})
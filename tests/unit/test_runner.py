@@ -1,6 +1,7 @@
 """Tests for ClaudeRunner (CliClaudeRunner)."""
 
 import subprocess
+from typing import NamedTuple
 from unittest.mock import patch
 
 import pytest
@@ -8,44 +9,50 @@ import pytest
 from agentic_dev_pipeline.runner import CliClaudeRunner
 
 
+class FakeResult(NamedTuple):
+    """Stand-in for the CompletedProcess that subprocess.run returns."""
+
+    returncode: int
+    stdout: str = ""
+    stderr: str = ""
+
+
 class TestCliClaudeRunner:
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        """Retry backoff never really sleeps, even in a test that forgets to stub it."""
+        monkeypatch.setattr("agentic_dev_pipeline.runner.time.sleep", lambda _s: None)
+
     def test_success(self):
         runner = CliClaudeRunner()
-        mock_result = type("Result", (), {"returncode": 0, "stdout": "hello", "stderr": ""})()
+        mock_result = FakeResult(0, "hello")
         with patch("agentic_dev_pipeline.runner.subprocess.run", return_value=mock_result):
             output = runner.run("test prompt")
         assert output == "hello"
 
     def test_retry_on_nonzero_exit(self):
         runner = CliClaudeRunner()
-        fail = type("R", (), {"returncode": 1, "stdout": "", "stderr": "err"})()
-        ok = type("R", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
-        with (
-            patch("agentic_dev_pipeline.runner.subprocess.run", side_effect=[fail, ok]),
-            patch("agentic_dev_pipeline.runner.time.sleep"),
-        ):
+        fail = FakeResult(1, stderr="err")
+        ok = FakeResult(0, "ok")
+        with patch("agentic_dev_pipeline.runner.subprocess.run", side_effect=[fail, ok]):
             output = runner.run("test", max_retries=2)
         assert output == "ok"
 
     def test_timeout_retries(self):
         runner = CliClaudeRunner()
-        ok = type("R", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
-        with (
-            patch(
-                "agentic_dev_pipeline.runner.subprocess.run",
-                side_effect=[subprocess.TimeoutExpired("claude", 10), ok],
-            ),
-            patch("agentic_dev_pipeline.runner.time.sleep"),
+        ok = FakeResult(0, "ok")
+        with patch(
+            "agentic_dev_pipeline.runner.subprocess.run",
+            side_effect=[subprocess.TimeoutExpired("claude", 10), ok],
         ):
             output = runner.run("test", timeout=10, max_retries=2)
         assert output == "ok"
 
     def test_max_retries_exceeded_raises(self):
         runner = CliClaudeRunner()
-        fail = type("R", (), {"returncode": 1, "stdout": "", "stderr": "err"})()
+        fail = FakeResult(1, stderr="err")
         with (
             patch("agentic_dev_pipeline.runner.subprocess.run", return_value=fail),
-            patch("agentic_dev_pipeline.runner.time.sleep"),
             pytest.raises(RuntimeError, match="claude failed after 2 attempts"),
         ):
             runner.run("test", max_retries=2)
@@ -68,7 +75,47 @@ class TestCliClaudeRunner:
                 "agentic_dev_pipeline.runner.subprocess.run",
                 side_effect=subprocess.TimeoutExpired("claude", 10),
             ),
-            patch("agentic_dev_pipeline.runner.time.sleep"),
             pytest.raises(RuntimeError, match="claude failed after 2 attempts"),
         ):
             runner.run("test", timeout=10, max_retries=2)
+
+    def test_resolves_executable_once(self):
+        runner = CliClaudeRunner(model="haiku")
+        ok = FakeResult(0, "ok")
+        with (
+            patch(
+                "agentic_dev_pipeline.runner.shutil.which", return_value="/opt/bin/claude"
+            ) as which,
+            patch("agentic_dev_pipeline.runner.subprocess.run", return_value=ok) as run,
+        ):
+            runner.run("a")
+            runner.run("b")
+        assert which.call_count == 1
+        assert run.call_args.args[0] == [
+            "/opt/bin/claude",
+            "--print",
+            "--model",
+            "haiku",
+            "-p",
+            "b",
+        ]
+
+    def test_given_executable_skips_lookup(self):
+        runner = CliClaudeRunner(executable="/usr/local/bin/claude")
+        ok = FakeResult(0, "ok")
+        with (
+            patch("agentic_dev_pipeline.runner.shutil.which") as which,
+            patch("agentic_dev_pipeline.runner.subprocess.run", return_value=ok) as run,
+        ):
+            runner.run("a")
+        which.assert_not_called()
+        assert run.call_args.args[0][0] == "/usr/local/bin/claude"
+
+    def test_stdout_sink(self, tmp_path, write_exec):
+        claude = tmp_path / "claude"
+        write_exec(claude, b'#!/bin/sh\necho "got $3"\n')
+        log = tmp_path / "out.log"
+        runner = CliClaudeRunner(executable=str(claude))
+        with log.open("ab") as f:
+            assert runner.run("hello", stdout_sink=f.fileno()) == ""
+        assert log.read_text() == "got hello\n"
@@ -0,0 +1,57 @@
+"""Tests for run_triangular_verification()."""
+
+import pytest
+
+from agentic_dev_pipeline import verify
+from agentic_dev_pipeline.detect import ProjectConfig
+from agentic_dev_pipeline.domain import TRIANGULAR_PASS_MARKER
+from agentic_dev_pipeline.verify import run_triangular_verification
+
+
+class _Runner:
+    def __init__(self, review: str, verdict: str = TRIANGULAR_PASS_MARKER):
+        self.outputs = [review, verdict]
+        self.prompts: list[str] = []
+
+    def run(self, prompt, *, timeout=300, max_retries=2, logger=None):
+        self.prompts.append(prompt)
+        return self.outputs[len(self.prompts) - 1]
+
+
+class TestRunTriangularVerification:
+    def _verify(self, tmp_path, runner):
+        return run_triangular_verification(
+            requirements_file=tmp_path / "requirements.md",
+            output_dir=tmp_path / "out",
+            config=ProjectConfig(changed_files=["a.py"]),
+            runner=runner,
+        )
+
+    def test_blind_review_passed_inline(self, tmp_path):
+        runner = _Runner("## Review\nadds numbers")
+        assert self._verify(tmp_path, runner) is True
+        assert "<blind-review>\n## Review\nadds numbers\n</blind-review>" in runner.prompts[1]
+        assert (tmp_path / "out" / "blind-review.md").read_text() == "## Review\nadds numbers"
+        assert (tmp_path / "out" / "discrepancy-report.md").read_text() == TRIANGULAR_PASS_MARKER
+
+    def test_large_review_referenced_by_path(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(verify, "_INLINE_REVIEW_LIMIT", 4)
+        runner = _Runner("long review", verdict="Requirements Missed: FR-1")
+        assert self._verify(tmp_path, runner) is False
+        assert "<blind-review>" not in runner.prompts[1]
+        assert str(tmp_path / "out" / "blind-review.md") in runner.prompts[1]
+        assert (tmp_path / "out" / "blind-review.md").read_text() == "long review"
+
+    def test_limit_counts_bytes_not_characters(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(verify, "_INLINE_REVIEW_LIMIT", 8)
+        runner = _Runner("検証済み")  # 4 characters, 12 bytes
+        self._verify(tmp_path, runner)
+        assert "<blind-review>" not in runner.prompts[1]
+
+    def test_failed_write_stops_before_agent_c(self, tmp_path):
+        (tmp_path / "out" / "blind-review.md").mkdir(parents=True)  # write_text fails
+        runner = _Runner("## Review")
+        with pytest.raises(IsADirectoryError):
+            self._verify(tmp_path, runner)
+        assert len(runner.prompts) == 1
+        assert not (tmp_path / "out" / "discrepancy-report.md").exists()